@@ -2,16 +2,37 @@
 Core ARK server management modules
 """
 
-from .steamcmd import SteamCMDManager
-from .config import ServerConfig
-from .server import ServerController
-from .backup import BackupManager
-from .rcon import RCONClient
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing one manager does not pull in socket/subprocess for the others
+_LAZY_IMPORTS = {
+    'SteamCMDManager': '.steamcmd',
+    'ServerConfig': '.config',
+    'ServerSnapshot': '.config',
+    'ServerController': '.server',
+    'BackupManager': '.backup',
+    'RCONClient': '.rcon',
+}
 
 __all__ = [
     'SteamCMDManager',
     'ServerConfig',
+    'ServerSnapshot',
     'ServerController',
     'BackupManager',
     'RCONClient',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
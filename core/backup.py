@@ -2,11 +2,85 @@
 Server backup management
 """
 
+import os
 import shutil
+import tarfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from utils.validation import validate_path
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# ARK saves are hundreds of MB; use 1 MiB chunks wherever shutil falls back
+# to a read/write loop (the POSIX default is only 64 KiB)
+COPY_BUFSIZE = 1024 * 1024
+if shutil.COPY_BUFSIZE < COPY_BUFSIZE:
+    shutil.COPY_BUFSIZE = COPY_BUFSIZE
+
+# Copies are IO-bound and release the GIL, so threads overlap syscall latency
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _copy_and_measure(src: Path, dst: Path) -> int:
+    """Copy a directory tree with a thread pool, returning total bytes copied
+    
+    File sizes come from the scandir entries used to walk the source, so no
+    second pass over the backup is needed to report its size. Like copytree,
+    files and directories keep their timestamps and permission bits.
+    """
+    stack = [(str(src), str(dst))]
+    dirs = []
+    futures = []
+    total = 0
+    
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        try:
+            while stack:
+                src_dir, dst_dir = stack.pop()
+                os.makedirs(dst_dir, exist_ok=True)
+                dirs.append((src_dir, dst_dir))
+                with os.scandir(src_dir) as entries:
+                    for entry in entries:
+                        target = os.path.join(dst_dir, entry.name)
+                        if entry.is_dir():
+                            stack.append((entry.path, target))
+                        else:
+                            total += entry.stat().st_size
+                            futures.append(pool.submit(shutil.copy2, entry.path, target))
+            
+            for future in as_completed(futures):
+                future.result()
+            
+            # Children before parents: filling a directory bumps its mtime
+            for src_dir, dst_dir in reversed(dirs):
+                shutil.copystat(src_dir, dst_dir)
+            return total
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _archive_tree(src: Path, archive_base: Path) -> Path:
+    """Stream a directory tree into one compressed tar file, returning its path
+    
+    Uses zstd when the optional zstandard package is installed, gzip otherwise.
+    """
+    if zstandard is not None:
+        archive_path = archive_base.with_name(archive_base.name + ".tar.zst")
+        with open(archive_path, 'wb') as raw:
+            with zstandard.ZstdCompressor(level=3).stream_writer(raw) as zst:
+                with tarfile.open(fileobj=zst, mode='w|') as tar:
+                    tar.add(src, arcname=src.name)
+    else:
+        archive_path = archive_base.with_name(archive_base.name + ".tar.gz")
+        with tarfile.open(archive_path, 'w:gz', compresslevel=3) as tar:
+            tar.add(src, arcname=src.name)
+    return archive_path
+
 
 class BackupManager:
     """Handles manual backups of server data"""
@@ -16,14 +90,12 @@ class BackupManager:
         self.base_dir = validate_path(str(base_dir))
         self.backup_dir = self.base_dir / "backups"
     
-    def create_backup(self) -> bool:
-        """Create timestamped backup"""
+    def create_backup(self, compress: bool = False) -> bool:
+        """Create timestamped backup, optionally as a single compressed archive"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"backup_{timestamp}"
         
         try:
-            backup_path.mkdir(parents=True, exist_ok=True)
-            
             saved_dir = self.server_dir / "ShooterGame" / "Saved"
             if not saved_dir.exists():
                 print("WARNING: No Saved directory found - nothing to backup")
@@ -33,9 +105,13 @@ class BackupManager:
             print(f"  Source: {saved_dir}")
             print(f"  Including: SavedArks/, Config/ (GameUserSettings.ini, Game.ini), Logs/")
             
-            shutil.copytree(saved_dir, backup_path / "Saved", dirs_exist_ok=True)
-            
-            total_size = sum(f.stat().st_size for f in backup_path.rglob('*') if f.is_file())
+            if compress:
+                self.backup_dir.mkdir(parents=True, exist_ok=True)
+                backup_path = _archive_tree(saved_dir, backup_path)
+                total_size = backup_path.stat().st_size
+            else:
+                backup_path.mkdir(parents=True, exist_ok=True)
+                total_size = _copy_and_measure(saved_dir, backup_path / "Saved")
             size_mb = total_size / (1024 * 1024)
             
             print(f"✓ Backup created: {backup_path}")
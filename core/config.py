@@ -2,421 +2,471 @@
 ARK server configuration management
 """
 
-import configparser
+import hashlib
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from utils.validation import validate_path, validate_mod_id
+from utils.ini import FastIni
+
+# Cache key used for INI files that do not exist yet
+_MISSING_FILE = (-1, -1)
+
+GAME_MODE_SECTION = '/Script/ShooterGame.ShooterGameMode'
+
+# (settings key, INI key, value type) for each section of GameUserSettings.ini
+_GAME_USER_FIELDS = {
+    'ServerSettings': (
+        ('server_password', 'ServerPassword', str),
+        ('admin_password', 'ServerAdminPassword', str),
+        ('xp_multiplier', 'XPMultiplier', float),
+        ('taming_speed', 'TamingSpeedMultiplier', float),
+        ('harvest_amount', 'HarvestAmountMultiplier', float),
+        ('tamed_dino_damage', 'TamedDinoDamageMultiplier', float),
+        ('max_structures_in_range', 'TheMaxStructuresInRange', int),
+        ('difficulty_offset', 'DifficultyOffset', float),
+        ('override_official_difficulty', 'OverrideOfficialDifficulty', float),
+        ('pve_mode', 'ServerPVE', bool),
+        ('rcon_enabled', 'RCONEnabled', bool),
+        ('rcon_port', 'RCONPort', int),
+        ('active_mods', 'ActiveMods', str),
+        # Initial server settings (one-time setup)
+        ('allow_anyone_baby_imprint', 'AllowAnyoneBabyImprintCuddle', bool),
+        ('allow_cave_building_pve', 'AllowCaveBuildingPvE', bool),
+        ('allow_flyer_carry_pve', 'AllowFlyerCarryPvE', bool),
+        ('always_allow_structure_pickup', 'AlwaysAllowStructurePickup', bool),
+        ('always_notify_player_left', 'AlwaysNotifyPlayerLeft', bool),
+        ('dino_count_multiplier', 'DinoCountMultiplier', float),
+        ('global_voice_chat', 'globalVoiceChat', bool),
+        ('player_stamina_drain', 'PlayerCharacterStaminaDrainMultiplier', float),
+        ('player_water_drain', 'PlayerCharacterWaterDrainMultiplier', float),
+        ('pve_allow_structures_at_drops', 'PvEAllowStructuresAtSupplyDrops', bool),
+        ('random_supply_crate_points', 'RandomSupplyCratePoints', bool),
+        ('show_floating_damage', 'ShowFloatingDamageText', bool),
+        ('enable_cryopod_nerf', 'EnableCryopodNerf', bool),
+        ('no_tribute_downloads', 'noTributeDownloads', bool),
+        ('prevent_download_dinos', 'PreventDownloadDinos', bool),
+        ('prevent_download_items', 'PreventDownloadItems', bool),
+        ('prevent_download_survivors', 'PreventDownloadSurvivors', bool),
+        ('prevent_upload_dinos', 'PreventUploadDinos', bool),
+        ('prevent_upload_items', 'PreventUploadItems', bool),
+        ('prevent_upload_survivors', 'PreventUploadSurvivors', bool),
+    ),
+    'SessionSettings': (
+        ('server_name', 'SessionName', str),
+        ('max_players', 'MaxPlayers', int),
+    ),
+}
+
+# (settings key, INI key, value type) for Game.ini
+_GAME_INI_FIELDS = {
+    GAME_MODE_SECTION: (
+        # Player stats
+        ('player_health_mult', 'PerLevelStatsMultiplier_Player[0]', float),
+        ('player_stamina_mult', 'PerLevelStatsMultiplier_Player[1]', float),
+        ('player_weight_mult', 'PerLevelStatsMultiplier_Player[5]', float),
+        # Dino stats
+        ('dino_health_mult', 'PerLevelStatsMultiplier_DinoTamed[0]', float),
+        ('dino_stamina_mult', 'PerLevelStatsMultiplier_DinoTamed[1]', float),
+        ('dino_weight_mult', 'PerLevelStatsMultiplier_DinoTamed[5]', float),
+        # Baby/dino multipliers
+        ('baby_cuddle_interval', 'BabyCuddleIntervalMultiplier', float),
+        ('baby_food_consumption', 'BabyFoodConsumptionSpeedMultiplier', float),
+        ('baby_imprint_amount', 'BabyImprintAmountMultiplier', float),
+        ('baby_mature_speed', 'BabyMatureSpeedMultiplier', float),
+        # XP multipliers
+        ('craft_xp', 'CraftXPMultiplier', float),
+        ('generic_xp', 'GenericXPMultiplier', float),
+        ('harvest_xp', 'HarvestXPMultiplier', float),
+        ('kill_xp', 'KillXPMultiplier', float),
+        # Farming multipliers
+        ('crop_decay_speed', 'CropDecaySpeedMultiplier', float),
+        ('crop_growth_speed', 'CropGrowthSpeedMultiplier', float),
+        # Egg/breeding multipliers
+        ('egg_hatch_speed', 'EggHatchSpeedMultiplier', float),
+        ('lay_egg_interval', 'LayEggIntervalMultiplier', float),
+        ('mating_interval', 'MatingIntervalMultiplier', float),
+        ('mating_speed', 'MatingSpeedMultiplier', float),
+        # Loot quality
+        ('supply_crate_loot_quality', 'SupplyCrateLootQualityMultiplier', float),
+        # Structure settings
+        ('structure_damage_repair_cooldown', 'StructureDamageRepairCooldown', int),
+        # Boolean settings
+        ('allow_flyer_speed_leveling', 'bAllowFlyerSpeedLeveling', bool),
+        ('allow_speed_leveling', 'bAllowSpeedLeveling', bool),
+        ('auto_unlock_engrams', 'bAutoUnlockAllEngrams', bool),
+        ('disable_friendly_fire', 'bDisableFriendlyFire', bool),
+    ),
+}
+
+
+_BOOL = ('False', 'True')
+
+
+def _fmt_bool(value) -> str:
+    return _BOOL[bool(value)]
+
+
+def _fmt_float(value) -> str:
+    """Shortest exact fixed-point form, e.g. 2.5 -> '2.5', 1e-7 -> '0.0000001', 1.0 -> '1'"""
+    text = repr(float(value))
+    if 'e' in text:
+        text = format(Decimal(text), 'f')
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def _fmt_int(value) -> str:
+    return str(int(value))
+
+
+def _fmt_str(value) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+_FORMATTERS = {bool: _fmt_bool, float: _fmt_float, int: _fmt_int, str: _fmt_str}
+
+
+def _last(raw):
+    """The effective value of a key, i.e. the last one if it was repeated"""
+    return raw[-1] if isinstance(raw, list) else raw
+
+
+def _field_keys(fields: Dict) -> frozenset:
+    """All settings keys handled by a field table"""
+    return frozenset(key for rows in fields.values() for key, _, _ in rows)
+
+
+_GAME_USER_KEYS = _field_keys(_GAME_USER_FIELDS)
+_GAME_INI_KEYS = _field_keys(_GAME_INI_FIELDS)
+
+
+def _apply_fields(config: Dict, fields: Dict, settings: Dict, skip_empty: bool = False) -> bool:
+    """Copy provided settings into their INI sections using a field table
+    
+    Returns True if any stored value actually changed.
+    """
+    changed = False
+    for section, rows in fields.items():
+        values = config.setdefault(section, {})
+        for key, ini_key, kind in rows:
+            if key not in settings:
+                continue
+            value = settings[key]
+            if kind is not bool and skip_empty and (value is None or value == ''):
+                continue
+            value = _FORMATTERS[kind](value)
+            if values.get(ini_key) != value:
+                values[ini_key] = value
+                changed = True
+    return changed
+
+
+def _extract_fields(config: Dict, fields: Dict) -> Dict:
+    """Read typed settings out of INI sections using a field table"""
+    settings = {}
+    for section, rows in fields.items():
+        values = config.get(section, {})
+        for key, ini_key, kind in rows:
+            raw = _last(values.get(ini_key))
+            if raw is None:
+                continue
+            if kind is bool:
+                settings[key] = raw.lower() == 'true'
+                continue
+            try:
+                settings[key] = kind(raw)
+            except ValueError:
+                # One hand-edited value must not hide every other setting
+                print(f"WARNING: Ignoring invalid {ini_key}={raw!r} in [{section}]")
+    return settings
+
+
+@dataclass(frozen=True, slots=True)
+class ServerSnapshot:
+    """Everything the getters expose, parsed from one read of each INI file"""
+    server_name: str
+    active_mods: Tuple[str, ...]
+    settings: Mapping
+    stats: Mapping
 
 
 class ServerConfig:
     """Manages GameUserSettings.ini and Game.ini"""
     
-    def __init__(self, server_dir: Path):
-        self.server_dir = validate_path(str(server_dir))
+    def __init__(self, server_dir: Path, *, validated: bool = False):
+        # Callers holding a path from validate_path can skip re-validating it
+        self.server_dir = server_dir if validated else validate_path(str(server_dir))
         self.config_dir = self.server_dir / "ShooterGame" / "Saved" / "Config" / "WindowsServer"
         self.game_user_settings = self.config_dir / "GameUserSettings.ini"
         self.game_ini = self.config_dir / "Game.ini"
+        # Parsed INI contents keyed by path, tagged with the file's (mtime, size)
+        self._cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]] = {}
+        # Writes deferred by batch(), flushed once per file when the batch ends
+        self._disk_hash: Dict[Path, bytes] = {}
+        self._batch_depth = 0
+        # Last snapshot and the parsed INI dicts it was built from
+        self._snapshot: Optional[Tuple[Dict, Dict, ServerSnapshot]] = None
+        self._pending: Dict[Path, Dict[str, Dict[str, str]]] = {}
+        # False if any write in the last flushed batch failed
+        self._batch_ok = True
+    
+    @contextmanager
+    def batch(self):
+        """Group updates so each INI file is read and written at most once
+        
+        Inside the block, writes are kept in memory and later reads see them.
+        Batches may be nested; files are written when the outermost one exits
+        normally. If it exits with an exception, the pending writes are dropped.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._pending = {}
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending = self._pending, {}
+                results = [
+                    self._write_ini(file_path, config, sync_dir=False)
+                    for file_path, config in pending.items()
+                ]
+                self._batch_ok = None not in results
+                # One directory sync covers every rename in the batch
+                if any(results):
+                    self._fsync_dir()
     
     def _ensure_config_dir(self):
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
-    def _read_ini(self, file_path: Path) -> configparser.ConfigParser:
-        """Read INI file preserving all keys"""
-        config = configparser.ConfigParser()
-        config.optionxform = str  # Case-sensitive
-        
-        if file_path.exists():
+    def _fsync_dir(self):
+        """Make renames in the config directory durable (best effort, POSIX only)"""
+        if os.name != 'posix':
+            return
+        try:
+            fd = os.open(self.config_dir, os.O_RDONLY)
             try:
-                config.read(file_path, encoding='utf-8')
-            except Exception as e:
-                print(f"WARNING: Error reading {file_path.name}: {e}")
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _stat_key(st: os.stat_result) -> Tuple[int, int]:
+        return st.st_mtime_ns, st.st_size
+    
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def _read_ini_ro(self, file_path: Path) -> Dict[str, Dict[str, str]]:
+        """Read INI file into {section: {key: value}}, sharing the cached dict
         
-        return config
+        Parsed results are reused until the file's mtime or size changes.
+        The returned dict is the cache entry itself and must not be modified.
+        """
+        pending = self._pending.get(file_path)
+        if pending is not None:
+            return pending
+        
+        try:
+            key = self._stat_key(file_path.stat())
+        except FileNotFoundError:
+            # A deleted file must be recreated even if its contents look unchanged
+            self._disk_hash.pop(file_path, None)
+            key = _MISSING_FILE
+        
+        cached = self._cache.get(file_path)
+        if cached is None or cached[0] != key:
+            cached = self._load_ini(file_path) if key != _MISSING_FILE else (key, {})
+            self._cache[file_path] = cached
+        
+        return cached[1]
     
-    def _write_ini(self, file_path: Path, config: configparser.ConfigParser):
-        """Write INI file safely"""
+    def _read_ini(self, file_path: Path) -> Dict[str, Dict[str, str]]:
+        """Read INI file into a private {section: {key: value}} copy for editing"""
+        config = self._read_ini_ro(file_path)
+        return {section: dict(values) for section, values in config.items()}
+    
+    def _load_ini(self, file_path: Path) -> Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]:
+        """Parse INI file from disk, returning (stat key of the data read, contents)"""
+        try:
+            with open(file_path, 'rb') as f:
+                key = self._stat_key(os.fstat(f.fileno()))
+                data = f.read()
+        except FileNotFoundError:
+            self._disk_hash.pop(file_path, None)
+            return _MISSING_FILE, {}
+        except OSError as e:
+            self._disk_hash.pop(file_path, None)
+            print(f"WARNING: Error reading {file_path.name}: {e}")
+            return _MISSING_FILE, {}
+        
+        self._disk_hash[file_path] = self._digest(data)
+        try:
+            return key, FastIni.parse_text(data.decode('utf-8'))
+        except Exception as e:
+            print(f"WARNING: Error reading {file_path.name}: {e}")
+            return key, {}
+    
+    def _write_ini(self, file_path: Path, config: Dict[str, Dict[str, str]], sync_dir: bool = True) -> Optional[bool]:
+        """Write INI file safely via a temp file and atomic rename
+        
+        Returns True if the file on disk was replaced, False if there was
+        nothing to write (or the write was deferred by a batch), and None
+        if writing failed.
+        """
+        if self._batch_depth:
+            self._pending[file_path] = config
+            return False
+        
+        data = FastIni.dumps(config).encode('utf-8')
+        digest = self._digest(data)
+        if digest == self._disk_hash.get(file_path):
+            # Serialized form matches what was last read from disk
+            return False
+        
         self._ensure_config_dir()
+        tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                config.write(f, space_around_delimiters=False)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                # Make the new contents durable before the rename publishes them
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+            if sync_dir:
+                self._fsync_dir()
+            self._disk_hash[file_path] = digest
+            # Seed the cache with what was just written so the next read skips parsing
+            self._cache[file_path] = (self._stat_key(file_path.stat()), config)
             print(f"✓ Updated {file_path.name}")
+            return True
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             print(f"ERROR: Failed to write {file_path.name}: {e}")
+            return None
     
     def update_game_settings(self, settings: Dict):
         """Update GameUserSettings.ini with only provided settings"""
-        config = self._read_ini(self.game_user_settings)
-        
-        if not config.has_section('ServerSettings'):
-            config.add_section('ServerSettings')
-        if not config.has_section('SessionSettings'):
-            config.add_section('SessionSettings')
+        if _GAME_USER_KEYS.isdisjoint(settings):
+            return
         
-        # Only update settings that are provided
-        server_settings = {}
-        session_settings = {}
-        
-        # Basic server settings
-        if 'server_password' in settings:
-            server_settings['ServerPassword'] = settings['server_password']
-        if 'admin_password' in settings:
-            server_settings['ServerAdminPassword'] = settings['admin_password']
-        if 'xp_multiplier' in settings:
-            server_settings['XPMultiplier'] = settings['xp_multiplier']
-        if 'taming_speed' in settings:
-            server_settings['TamingSpeedMultiplier'] = settings['taming_speed']
-        if 'harvest_amount' in settings:
-            server_settings['HarvestAmountMultiplier'] = settings['harvest_amount']
-        if 'difficulty_offset' in settings:
-            server_settings['DifficultyOffset'] = settings['difficulty_offset']
-        if 'override_official_difficulty' in settings:
-            server_settings['OverrideOfficialDifficulty'] = settings['override_official_difficulty']
-        if 'pve_mode' in settings:
-            server_settings['ServerPVE'] = 'True' if settings['pve_mode'] else 'False'
-        if 'rcon_enabled' in settings:
-            server_settings['RCONEnabled'] = 'True' if settings['rcon_enabled'] else 'False'
-        if 'rcon_port' in settings:
-            server_settings['RCONPort'] = settings['rcon_port']
-        if 'active_mods' in settings:
-            server_settings['ActiveMods'] = settings['active_mods']
-        
-        # Initial server settings (one-time setup)
-        if 'allow_anyone_baby_imprint' in settings:
-            server_settings['AllowAnyoneBabyImprintCuddle'] = 'True' if settings['allow_anyone_baby_imprint'] else 'False'
-        if 'allow_cave_building_pve' in settings:
-            server_settings['AllowCaveBuildingPvE'] = 'True' if settings['allow_cave_building_pve'] else 'False'
-        if 'allow_flyer_carry_pve' in settings:
-            server_settings['AllowFlyerCarryPvE'] = 'True' if settings['allow_flyer_carry_pve'] else 'False'
-        if 'always_allow_structure_pickup' in settings:
-            server_settings['AlwaysAllowStructurePickup'] = 'True' if settings['always_allow_structure_pickup'] else 'False'
-        if 'always_notify_player_left' in settings:
-            server_settings['AlwaysNotifyPlayerLeft'] = 'True' if settings['always_notify_player_left'] else 'False'
-        if 'dino_count_multiplier' in settings:
-            server_settings['DinoCountMultiplier'] = settings['dino_count_multiplier']
-        if 'global_voice_chat' in settings:
-            server_settings['globalVoiceChat'] = 'True' if settings['global_voice_chat'] else 'False'
-        if 'player_stamina_drain' in settings:
-            server_settings['PlayerCharacterStaminaDrainMultiplier'] = settings['player_stamina_drain']
-        if 'player_water_drain' in settings:
-            server_settings['PlayerCharacterWaterDrainMultiplier'] = settings['player_water_drain']
-        if 'pve_allow_structures_at_drops' in settings:
-            server_settings['PvEAllowStructuresAtSupplyDrops'] = 'True' if settings['pve_allow_structures_at_drops'] else 'False'
-        if 'random_supply_crate_points' in settings:
-            server_settings['RandomSupplyCratePoints'] = 'True' if settings['random_supply_crate_points'] else 'False'
-        if 'show_floating_damage' in settings:
-            server_settings['ShowFloatingDamageText'] = 'True' if settings['show_floating_damage'] else 'False'
-        if 'enable_cryopod_nerf' in settings:
-            server_settings['EnableCryopodNerf'] = 'True' if settings['enable_cryopod_nerf'] else 'False'
-        if 'no_tribute_downloads' in settings:
-            server_settings['noTributeDownloads'] = 'True' if settings['no_tribute_downloads'] else 'False'
-        if 'prevent_download_dinos' in settings:
-            server_settings['PreventDownloadDinos'] = 'True' if settings['prevent_download_dinos'] else 'False'
-        if 'prevent_download_items' in settings:
-            server_settings['PreventDownloadItems'] = 'True' if settings['prevent_download_items'] else 'False'
-        if 'prevent_download_survivors' in settings:
-            server_settings['PreventDownloadSurvivors'] = 'True' if settings['prevent_download_survivors'] else 'False'
-        if 'prevent_upload_dinos' in settings:
-            server_settings['PreventUploadDinos'] = 'True' if settings['prevent_upload_dinos'] else 'False'
-        if 'prevent_upload_items' in settings:
-            server_settings['PreventUploadItems'] = 'True' if settings['prevent_upload_items'] else 'False'
-        if 'prevent_upload_survivors' in settings:
-            server_settings['PreventUploadSurvivors'] = 'True' if settings['prevent_upload_survivors'] else 'False'
-        
-        # Session settings
-        if 'server_name' in settings:
-            session_settings['SessionName'] = settings['server_name']
-        if 'max_players' in settings:
-            session_settings['MaxPlayers'] = settings['max_players']
-        
-        for key, value in server_settings.items():
-            if value is not None and value != '':
-                config.set('ServerSettings', key, str(value))
-        
-        for key, value in session_settings.items():
-            if value is not None and value != '':
-                config.set('SessionSettings', key, str(value))
-        
-        self._write_ini(self.game_user_settings, config)
+        config = self._read_ini(self.game_user_settings)
+        if _apply_fields(config, _GAME_USER_FIELDS, settings, skip_empty=True):
+            self._write_ini(self.game_user_settings, config)
     
     def update_stat_multipliers(self, settings: Dict):
         """Update Game.ini with stat multipliers and game settings"""
-        config = self._read_ini(self.game_ini)
-        
-        section = '/Script/ShooterGame.ShooterGameMode'
-        if not config.has_section(section):
-            config.add_section(section)
-        
-        # Player stats
-        if 'player_health_mult' in settings:
-            config.set(section, 'PerLevelStatsMultiplier_Player[0]', str(settings['player_health_mult']))
-        if 'player_stamina_mult' in settings:
-            config.set(section, 'PerLevelStatsMultiplier_Player[1]', str(settings['player_stamina_mult']))
-        if 'player_weight_mult' in settings:
-            config.set(section, 'PerLevelStatsMultiplier_Player[5]', str(settings['player_weight_mult']))
-        
-        # Dino stats
-        if 'dino_health_mult' in settings:
-            config.set(section, 'PerLevelStatsMultiplier_DinoTamed[0]', str(settings['dino_health_mult']))
-        if 'dino_stamina_mult' in settings:
-            config.set(section, 'PerLevelStatsMultiplier_DinoTamed[1]', str(settings['dino_stamina_mult']))
-        if 'dino_weight_mult' in settings:
-            config.set(section, 'PerLevelStatsMultiplier_DinoTamed[5]', str(settings['dino_weight_mult']))
+        if _GAME_INI_KEYS.isdisjoint(settings):
+            return
         
-        # Baby/dino multipliers
-        if 'baby_cuddle_interval' in settings:
-            config.set(section, 'BabyCuddleIntervalMultiplier', str(settings['baby_cuddle_interval']))
-        if 'baby_food_consumption' in settings:
-            config.set(section, 'BabyFoodConsumptionSpeedMultiplier', str(settings['baby_food_consumption']))
-        if 'baby_imprint_amount' in settings:
-            config.set(section, 'BabyImprintAmountMultiplier', str(settings['baby_imprint_amount']))
-        if 'baby_mature_speed' in settings:
-            config.set(section, 'BabyMatureSpeedMultiplier', str(settings['baby_mature_speed']))
-        
-        # XP multipliers
-        if 'craft_xp' in settings:
-            config.set(section, 'CraftXPMultiplier', str(settings['craft_xp']))
-        if 'generic_xp' in settings:
-            config.set(section, 'GenericXPMultiplier', str(settings['generic_xp']))
-        if 'harvest_xp' in settings:
-            config.set(section, 'HarvestXPMultiplier', str(settings['harvest_xp']))
-        if 'kill_xp' in settings:
-            config.set(section, 'KillXPMultiplier', str(settings['kill_xp']))
-        
-        # Farming multipliers
-        if 'crop_decay_speed' in settings:
-            config.set(section, 'CropDecaySpeedMultiplier', str(settings['crop_decay_speed']))
-        if 'crop_growth_speed' in settings:
-            config.set(section, 'CropGrowthSpeedMultiplier', str(settings['crop_growth_speed']))
-        
-        # Egg/breeding multipliers
-        if 'egg_hatch_speed' in settings:
-            config.set(section, 'EggHatchSpeedMultiplier', str(settings['egg_hatch_speed']))
-        if 'lay_egg_interval' in settings:
-            config.set(section, 'LayEggIntervalMultiplier', str(settings['lay_egg_interval']))
-        if 'mating_interval' in settings:
-            config.set(section, 'MatingIntervalMultiplier', str(settings['mating_interval']))
-        if 'mating_speed' in settings:
-            config.set(section, 'MatingSpeedMultiplier', str(settings['mating_speed']))
-        
-        # Loot quality
-        if 'supply_crate_loot_quality' in settings:
-            config.set(section, 'SupplyCrateLootQualityMultiplier', str(settings['supply_crate_loot_quality']))
-        
-        # Structure settings
-        if 'structure_damage_repair_cooldown' in settings:
-            config.set(section, 'StructureDamageRepairCooldown', str(settings['structure_damage_repair_cooldown']))
-        
-        # Boolean settings
-        if 'allow_flyer_speed_leveling' in settings:
-            config.set(section, 'bAllowFlyerSpeedLeveling', 'True' if settings['allow_flyer_speed_leveling'] else 'False')
-        if 'allow_speed_leveling' in settings:
-            config.set(section, 'bAllowSpeedLeveling', 'True' if settings['allow_speed_leveling'] else 'False')
-        if 'auto_unlock_engrams' in settings:
-            config.set(section, 'bAutoUnlockAllEngrams', 'True' if settings['auto_unlock_engrams'] else 'False')
-        if 'disable_friendly_fire' in settings:
-            config.set(section, 'bDisableFriendlyFire', 'True' if settings['disable_friendly_fire'] else 'False')
-        
-        self._write_ini(self.game_ini, config)
+        config = self._read_ini(self.game_ini)
+        if _apply_fields(config, _GAME_INI_FIELDS, settings):
+            self._write_ini(self.game_ini, config)
+    
+    def apply_changes(self, changes: Dict) -> bool:
+        """Route settings to whichever INI file owns them, writing each file at most once
+        
+        Returns False if a file could not be written. Inside an outer batch
+        nothing is written yet, so this returns True.
+        """
+        nested = self._batch_depth > 0
+        with self.batch():
+            self.update_game_settings(changes)
+            self.update_stat_multipliers(changes)
+        return nested or self._batch_ok
     
     def get_stat_multipliers(self) -> Dict:
         """Get current stat multipliers and game settings"""
-        config = self._read_ini(self.game_ini)
-        section = '/Script/ShooterGame.ShooterGameMode'
-        multipliers = {}
-        
-        if config.has_section(section):
-            # Player stats
-            if config.has_option(section, 'PerLevelStatsMultiplier_Player[0]'):
-                multipliers['player_health_mult'] = float(config.get(section, 'PerLevelStatsMultiplier_Player[0]'))
-            if config.has_option(section, 'PerLevelStatsMultiplier_Player[1]'):
-                multipliers['player_stamina_mult'] = float(config.get(section, 'PerLevelStatsMultiplier_Player[1]'))
-            if config.has_option(section, 'PerLevelStatsMultiplier_Player[5]'):
-                multipliers['player_weight_mult'] = float(config.get(section, 'PerLevelStatsMultiplier_Player[5]'))
-            
-            # Dino stats
-            if config.has_option(section, 'PerLevelStatsMultiplier_DinoTamed[0]'):
-                multipliers['dino_health_mult'] = float(config.get(section, 'PerLevelStatsMultiplier_DinoTamed[0]'))
-            if config.has_option(section, 'PerLevelStatsMultiplier_DinoTamed[1]'):
-                multipliers['dino_stamina_mult'] = float(config.get(section, 'PerLevelStatsMultiplier_DinoTamed[1]'))
-            if config.has_option(section, 'PerLevelStatsMultiplier_DinoTamed[5]'):
-                multipliers['dino_weight_mult'] = float(config.get(section, 'PerLevelStatsMultiplier_DinoTamed[5]'))
-            
-            # Baby/dino multipliers
-            if config.has_option(section, 'BabyCuddleIntervalMultiplier'):
-                multipliers['baby_cuddle_interval'] = float(config.get(section, 'BabyCuddleIntervalMultiplier'))
-            if config.has_option(section, 'BabyFoodConsumptionSpeedMultiplier'):
-                multipliers['baby_food_consumption'] = float(config.get(section, 'BabyFoodConsumptionSpeedMultiplier'))
-            if config.has_option(section, 'BabyImprintAmountMultiplier'):
-                multipliers['baby_imprint_amount'] = float(config.get(section, 'BabyImprintAmountMultiplier'))
-            if config.has_option(section, 'BabyMatureSpeedMultiplier'):
-                multipliers['baby_mature_speed'] = float(config.get(section, 'BabyMatureSpeedMultiplier'))
-            
-            # XP multipliers
-            if config.has_option(section, 'CraftXPMultiplier'):
-                multipliers['craft_xp'] = float(config.get(section, 'CraftXPMultiplier'))
-            if config.has_option(section, 'GenericXPMultiplier'):
-                multipliers['generic_xp'] = float(config.get(section, 'GenericXPMultiplier'))
-            if config.has_option(section, 'HarvestXPMultiplier'):
-                multipliers['harvest_xp'] = float(config.get(section, 'HarvestXPMultiplier'))
-            if config.has_option(section, 'KillXPMultiplier'):
-                multipliers['kill_xp'] = float(config.get(section, 'KillXPMultiplier'))
-            
-            # Farming multipliers
-            if config.has_option(section, 'CropDecaySpeedMultiplier'):
-                multipliers['crop_decay_speed'] = float(config.get(section, 'CropDecaySpeedMultiplier'))
-            if config.has_option(section, 'CropGrowthSpeedMultiplier'):
-                multipliers['crop_growth_speed'] = float(config.get(section, 'CropGrowthSpeedMultiplier'))
-            
-            # Egg/breeding multipliers
-            if config.has_option(section, 'EggHatchSpeedMultiplier'):
-                multipliers['egg_hatch_speed'] = float(config.get(section, 'EggHatchSpeedMultiplier'))
-            if config.has_option(section, 'LayEggIntervalMultiplier'):
-                multipliers['lay_egg_interval'] = float(config.get(section, 'LayEggIntervalMultiplier'))
-            if config.has_option(section, 'MatingIntervalMultiplier'):
-                multipliers['mating_interval'] = float(config.get(section, 'MatingIntervalMultiplier'))
-            if config.has_option(section, 'MatingSpeedMultiplier'):
-                multipliers['mating_speed'] = float(config.get(section, 'MatingSpeedMultiplier'))
-            
-            # Loot quality
-            if config.has_option(section, 'SupplyCrateLootQualityMultiplier'):
-                multipliers['supply_crate_loot_quality'] = float(config.get(section, 'SupplyCrateLootQualityMultiplier'))
-            
-            # Structure damage repair
-            if config.has_option(section, 'StructureDamageRepairCooldown'):
-                multipliers['structure_damage_repair_cooldown'] = int(config.get(section, 'StructureDamageRepairCooldown'))
-            
-            # Boolean settings in Game.ini
-            if config.has_option(section, 'bAllowFlyerSpeedLeveling'):
-                multipliers['allow_flyer_speed_leveling'] = config.get(section, 'bAllowFlyerSpeedLeveling').lower() == 'true'
-            if config.has_option(section, 'bAllowSpeedLeveling'):
-                multipliers['allow_speed_leveling'] = config.get(section, 'bAllowSpeedLeveling').lower() == 'true'
-            if config.has_option(section, 'bAutoUnlockAllEngrams'):
-                multipliers['auto_unlock_engrams'] = config.get(section, 'bAutoUnlockAllEngrams').lower() == 'true'
-            if config.has_option(section, 'bDisableFriendlyFire'):
-                multipliers['disable_friendly_fire'] = config.get(section, 'bDisableFriendlyFire').lower() == 'true'
-        
-        return multipliers
+        return dict(self.snapshot().stats)
     
-    def set_mods(self, mod_ids: List[str]) -> bool:
-        """Set active mods"""
-        validated = [m.strip() for m in mod_ids if validate_mod_id(m)]
+    def set_mods(self, mod_ids: Iterable[Union[str, int]]) -> bool:
+        """Set active mods (numeric strings or ints)"""
+        validated = [
+            mod_id for mod_id in (str(m).strip() for m in mod_ids)
+            if validate_mod_id(mod_id)
+        ]
         
         if not validated:
             print("No valid mods provided")
             return False
         
-        config = self._read_ini(self.game_user_settings)
-        if not config.has_section('ServerSettings'):
-            config.add_section('ServerSettings')
-        
-        config.set('ServerSettings', 'ActiveMods', ','.join(validated))
-        self._write_ini(self.game_user_settings, config)
+        if self.update_mods_atomic(validated) is None:
+            print("ERROR: Mods were not saved")
+            return False
         print(f"✓ Configured {len(validated)} mod(s)")
         return True
     
-    def clear_mods(self):
+    def clear_mods(self) -> bool:
         """Remove all mods"""
-        config = self._read_ini(self.game_user_settings)
-        
-        if config.has_option('ServerSettings', 'ActiveMods'):
-            config.remove_option('ServerSettings', 'ActiveMods')
-            self._write_ini(self.game_user_settings, config)
+        result = self.update_mods_atomic([])
+        if result is None:
+            print("ERROR: Mods were not cleared")
+            return False
+        if result:
             print("✓ Cleared all mods")
+        return True
     
-    def get_active_mods(self) -> List[str]:
-        """Get currently active mods"""
+    def update_mods_atomic(self, mod_ids: List[str]) -> Optional[bool]:
+        """Replace ActiveMods with already-validated IDs in one read-modify-write
+        
+        An empty list removes ActiveMods. Returns False, without touching the
+        file, if the mod list is already as requested, and None if the write
+        failed.
+        """
         config = self._read_ini(self.game_user_settings)
+        server = config.setdefault('ServerSettings', {})
+        active_mods = ','.join(mod_ids) if mod_ids else None
         
-        if config.has_option('ServerSettings', 'ActiveMods'):
-            mods = config.get('ServerSettings', 'ActiveMods')
-            return [m.strip() for m in mods.split(',') if m.strip()]
+        if _last(server.get('ActiveMods')) == active_mods:
+            return False
+        if active_mods is None:
+            del server['ActiveMods']
+        else:
+            server['ActiveMods'] = active_mods
         
-        return []
+        if self._write_ini(self.game_user_settings, config) is None:
+            return None
+        return True
+    
+    def get_active_mods(self) -> List[str]:
+        """Get currently active mods"""
+        return list(self.snapshot().active_mods)
     
     def get_server_name(self) -> str:
         """Get current server name"""
-        config = self._read_ini(self.game_user_settings)
-        
-        if config.has_option('SessionSettings', 'SessionName'):
-            return config.get('SessionSettings', 'SessionName')
-        
-        return "ARK Server"
+        return self.snapshot().server_name
     
     def get_server_settings(self) -> Dict:
         """Get current server settings"""
-        config = self._read_ini(self.game_user_settings)
-        settings = {}
-        
-        # ServerSettings
-        if config.has_option('ServerSettings', 'ServerPassword'):
-            settings['server_password'] = config.get('ServerSettings', 'ServerPassword')
-        if config.has_option('ServerSettings', 'ServerAdminPassword'):
-            settings['admin_password'] = config.get('ServerSettings', 'ServerAdminPassword')
-        if config.has_option('ServerSettings', 'XPMultiplier'):
-            settings['xp_multiplier'] = float(config.get('ServerSettings', 'XPMultiplier'))
-        if config.has_option('ServerSettings', 'TamingSpeedMultiplier'):
-            settings['taming_speed'] = float(config.get('ServerSettings', 'TamingSpeedMultiplier'))
-        if config.has_option('ServerSettings', 'HarvestAmountMultiplier'):
-            settings['harvest_amount'] = float(config.get('ServerSettings', 'HarvestAmountMultiplier'))
-        if config.has_option('ServerSettings', 'TamedDinoDamageMultiplier'):
-            settings['tamed_dino_damage'] = float(config.get('ServerSettings', 'TamedDinoDamageMultiplier'))
-        if config.has_option('ServerSettings', 'TheMaxStructuresInRange'):
-            settings['max_structures_in_range'] = int(config.get('ServerSettings', 'TheMaxStructuresInRange'))
-        if config.has_option('ServerSettings', 'DifficultyOffset'):
-            settings['difficulty_offset'] = float(config.get('ServerSettings', 'DifficultyOffset'))
-        if config.has_option('ServerSettings', 'OverrideOfficialDifficulty'):
-            settings['override_official_difficulty'] = float(config.get('ServerSettings', 'OverrideOfficialDifficulty'))
-        if config.has_option('ServerSettings', 'ServerPVE'):
-            settings['pve_mode'] = config.get('ServerSettings', 'ServerPVE').lower() == 'true'
-        if config.has_option('ServerSettings', 'RCONEnabled'):
-            settings['rcon_enabled'] = config.get('ServerSettings', 'RCONEnabled').lower() == 'true'
-        if config.has_option('ServerSettings', 'RCONPort'):
-            settings['rcon_port'] = int(config.get('ServerSettings', 'RCONPort'))
-        
-        # Initial server settings (one-time setup)
-        if config.has_option('ServerSettings', 'AllowAnyoneBabyImprintCuddle'):
-            settings['allow_anyone_baby_imprint'] = config.get('ServerSettings', 'AllowAnyoneBabyImprintCuddle').lower() == 'true'
-        if config.has_option('ServerSettings', 'AllowCaveBuildingPvE'):
-            settings['allow_cave_building_pve'] = config.get('ServerSettings', 'AllowCaveBuildingPvE').lower() == 'true'
-        if config.has_option('ServerSettings', 'AllowFlyerCarryPvE'):
-            settings['allow_flyer_carry_pve'] = config.get('ServerSettings', 'AllowFlyerCarryPvE').lower() == 'true'
-        if config.has_option('ServerSettings', 'AlwaysAllowStructurePickup'):
-            settings['always_allow_structure_pickup'] = config.get('ServerSettings', 'AlwaysAllowStructurePickup').lower() == 'true'
-        if config.has_option('ServerSettings', 'AlwaysNotifyPlayerLeft'):
-            settings['always_notify_player_left'] = config.get('ServerSettings', 'AlwaysNotifyPlayerLeft').lower() == 'true'
-        if config.has_option('ServerSettings', 'DinoCountMultiplier'):
-            settings['dino_count_multiplier'] = float(config.get('ServerSettings', 'DinoCountMultiplier'))
-        if config.has_option('ServerSettings', 'globalVoiceChat'):
-            settings['global_voice_chat'] = config.get('ServerSettings', 'globalVoiceChat').lower() == 'true'
-        if config.has_option('ServerSettings', 'PlayerCharacterStaminaDrainMultiplier'):
-            settings['player_stamina_drain'] = float(config.get('ServerSettings', 'PlayerCharacterStaminaDrainMultiplier'))
-        if config.has_option('ServerSettings', 'PlayerCharacterWaterDrainMultiplier'):
-            settings['player_water_drain'] = float(config.get('ServerSettings', 'PlayerCharacterWaterDrainMultiplier'))
-        if config.has_option('ServerSettings', 'PvEAllowStructuresAtSupplyDrops'):
-            settings['pve_allow_structures_at_drops'] = config.get('ServerSettings', 'PvEAllowStructuresAtSupplyDrops').lower() == 'true'
-        if config.has_option('ServerSettings', 'RandomSupplyCratePoints'):
-            settings['random_supply_crate_points'] = config.get('ServerSettings', 'RandomSupplyCratePoints').lower() == 'true'
-        if config.has_option('ServerSettings', 'ShowFloatingDamageText'):
-            settings['show_floating_damage'] = config.get('ServerSettings', 'ShowFloatingDamageText').lower() == 'true'
-        if config.has_option('ServerSettings', 'EnableCryopodNerf'):
-            settings['enable_cryopod_nerf'] = config.get('ServerSettings', 'EnableCryopodNerf').lower() == 'true'
-        if config.has_option('ServerSettings', 'noTributeDownloads'):
-            settings['no_tribute_downloads'] = config.get('ServerSettings', 'noTributeDownloads').lower() == 'true'
-        if config.has_option('ServerSettings', 'PreventDownloadDinos'):
-            settings['prevent_download_dinos'] = config.get('ServerSettings', 'PreventDownloadDinos').lower() == 'true'
-        if config.has_option('ServerSettings', 'PreventDownloadItems'):
-            settings['prevent_download_items'] = config.get('ServerSettings', 'PreventDownloadItems').lower() == 'true'
-        if config.has_option('ServerSettings', 'PreventDownloadSurvivors'):
-            settings['prevent_download_survivors'] = config.get('ServerSettings', 'PreventDownloadSurvivors').lower() == 'true'
-        if config.has_option('ServerSettings', 'PreventUploadDinos'):
-            settings['prevent_upload_dinos'] = config.get('ServerSettings', 'PreventUploadDinos').lower() == 'true'
-        if config.has_option('ServerSettings', 'PreventUploadItems'):
-            settings['prevent_upload_items'] = config.get('ServerSettings', 'PreventUploadItems').lower() == 'true'
-        if config.has_option('ServerSettings', 'PreventUploadSurvivors'):
-            settings['prevent_upload_survivors'] = config.get('ServerSettings', 'PreventUploadSurvivors').lower() == 'true'
-        
-        # SessionSettings
-        if config.has_option('SessionSettings', 'MaxPlayers'):
-            settings['max_players'] = int(config.get('SessionSettings', 'MaxPlayers'))
-        
-        return settings
\ No newline at end of file
+        return dict(self.snapshot().settings)
+    
+    def snapshot(self) -> ServerSnapshot:
+        """Get all current settings at once, rebuilt only when an INI file changed"""
+        game_user = self._read_ini_ro(self.game_user_settings)
+        game = self._read_ini_ro(self.game_ini)
+        
+        cached = self._snapshot
+        if cached is not None and cached[0] is game_user and cached[1] is game:
+            return cached[2]
+        
+        mods = _last(game_user.get('ServerSettings', {}).get('ActiveMods')) or ''
+        snap = ServerSnapshot(
+            server_name=_last(game_user.get('SessionSettings', {}).get('SessionName', "ARK Server")),
+            active_mods=tuple(m for m in (m.strip() for m in mods.split(',')) if m),
+            settings=MappingProxyType(_extract_fields(game_user, _GAME_USER_FIELDS)),
+            stats=MappingProxyType(_extract_fields(game, _GAME_INI_FIELDS)),
+        )
+        self._snapshot = (game_user, game, snap)
+        return snap
\ No newline at end of file
@@ -2,9 +2,10 @@
 RCON client for server communication
 """
 
+import select
 import socket
 import struct
-from typing import Optional
+from typing import List, Optional
 from utils.validation import validate_port, sanitize_input
 from utils.constants import (
     DEFAULT_RCON_PORT,
@@ -12,6 +13,26 @@ from utils.constants import (
     RCON_AUTH_RESPONSE, RCON_RESPONSE_VALUE
 )
 
+# Packet header: length, request id, packet type (little-endian int32s)
+_HDR = struct.Struct('<iii')
+
+# Largest body the Source RCON protocol sends in one packet
+RCON_MAX_BODY = 4096
+
+# Hard cap on a single reply body; ARK can exceed RCON_MAX_BODY, but a
+# length past this means a corrupt header or a misaligned stream
+RCON_MAX_REPLY = 1 << 20
+
+# Default seconds to wait on the socket for any single operation
+RCON_TIMEOUT = 5
+
+# Keepalive probing for long-lived sessions: idle seconds, interval, count
+_KEEPALIVE = (
+    ('TCP_KEEPIDLE', 60),
+    ('TCP_KEEPINTVL', 15),
+    ('TCP_KEEPCNT', 3),
+)
+
 
 class RCONClient:
     """Simple RCON client implementation"""
@@ -22,12 +43,22 @@ class RCONClient:
         self.password = password
         self.socket: Optional[socket.socket] = None
         self.authenticated = False
+        # Receive buffer reused across packets; oversized replies get a temporary one
+        self._rx = bytearray(_HDR.size + RCON_MAX_BODY)
     
     def connect(self) -> bool:
         """Connect and authenticate"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5)
+            self.socket.settimeout(RCON_TIMEOUT)
+            # Command packets are tiny; don't let Nagle hold them back
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Notice a dead server in minutes rather than the 2 hour default
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for name, value in _KEEPALIVE:
+                option = getattr(socket, name, None)  # Not every platform has these
+                if option is not None:
+                    self.socket.setsockopt(socket.IPPROTO_TCP, option, value)
             self.socket.connect((self.host, self.port))
             return self._authenticate()
         except Exception as e:
@@ -40,39 +71,157 @@ class RCONClient:
         self.authenticated = response is not None
         return self.authenticated
     
+    def __enter__(self):
+        self._ensure_connected()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.disconnect()
+    
+    def _ensure_connected(self) -> bool:
+        """Reuse the open session, connecting lazily if there is none or it died"""
+        if self.socket is not None and self.authenticated and not self._session_closed():
+            return True
+        return self._reconnect()
+    
+    def _session_closed(self) -> bool:
+        """True if the idle session became readable, i.e. the server closed it"""
+        # Between exchanges nothing is owed to us, so readable means EOF,
+        # a reset, or a stray late reply; none of those can be reused
+        try:
+            readable, _, _ = select.select([self.socket], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+    
     def send_command(self, command: str) -> Optional[str]:
-        """Send command to server"""
-        if not self.authenticated:
+        """Send command to server, reconnecting once if sending fails"""
+        if not self._ensure_connected():
             print("ERROR: Not authenticated")
             return None
         
-        command = sanitize_input(command)
-        self._send_packet(RCON_EXECCOMMAND, command)
+        packet = self._build_packet(RCON_EXECCOMMAND, sanitize_input(command))
+        for attempt in range(2):
+            try:
+                self.socket.sendall(packet)
+                break
+            except OSError:
+                # The command never reached the server, so sending it again
+                # on a fresh session cannot run it twice
+                if attempt or not self._reconnect():
+                    self.disconnect()
+                    return None
+        
         response = self._receive_packet()
-        return response[1] if response else None
+        if response is None:
+            # Never resend after a missed reply: the server may have run the
+            # command, and a late reply would be read as the next answer
+            self.disconnect()
+            return None
+        return response[1]
+    
+    def send_commands(self, commands: List[str], timeout: Optional[float] = None) -> List[Optional[str]]:
+        """Send several commands over one session, pipelining the requests
+        
+        timeout overrides how long to wait for each reply, for commands such
+        as saveworld that can take longer than RCON_TIMEOUT to answer.
+        """
+        if not self._ensure_connected():
+            print("ERROR: Not authenticated")
+            return [None] * len(commands)
+        
+        return self._exchange(commands, timeout)
+    
+    def _exchange(self, commands: List[str], timeout: Optional[float]) -> List[Optional[str]]:
+        # One write for the whole batch instead of one per command
+        payload = b''.join(
+            self._build_packet(RCON_EXECCOMMAND, sanitize_input(command))
+            for command in commands
+        )
+        for attempt in range(2):
+            try:
+                self.socket.sendall(payload)
+                break
+            except OSError as e:
+                # Nothing ran yet, so one resend on a fresh session is safe
+                if attempt or not self._reconnect():
+                    print(f"RCON send failed: {e}")
+                    self.disconnect()
+                    return [None] * len(commands)
+        
+        # Set after any reconnect so the override applies to the live socket
+        if timeout is not None:
+            self.socket.settimeout(timeout)
+        responses = []
+        try:
+            for _ in commands:
+                response = self._receive_packet()
+                if response is None:
+                    # Later replies can no longer be matched up; never resend
+                    self.disconnect()
+                    break
+                responses.append(response[1])
+        finally:
+            if timeout is not None and self.socket:
+                self.socket.settimeout(RCON_TIMEOUT)
+        return responses + [None] * (len(commands) - len(responses))
+    
+    def _reconnect(self) -> bool:
+        self.disconnect()
+        return self.connect()
     
     def _send_packet(self, packet_type: int, body: str):
+        self.socket.sendall(self._build_packet(packet_type, body))
+    
+    @staticmethod
+    def _build_packet(packet_type: int, body: str) -> bytearray:
         packet_id = 1
         body_bytes = body.encode('utf-8') + b'\x00\x00'
         length = 4 + 4 + len(body_bytes)
         
-        packet = struct.pack('<iii', length, packet_id, packet_type) + body_bytes
-        self.socket.sendall(packet)
+        packet = bytearray(_HDR.size + len(body_bytes))
+        _HDR.pack_into(packet, 0, length, packet_id, packet_type)
+        packet[_HDR.size:] = body_bytes
+        return packet
+    
+    def _recv_exact(self, view: memoryview) -> bool:
+        """Fill view completely, looping over short TCP reads"""
+        offset = 0
+        size = len(view)
+        while offset < size:
+            n = self.socket.recv_into(view[offset:])
+            if n == 0:
+                return False
+            offset += n
+        return True
     
     def _receive_packet(self) -> Optional[tuple]:
         try:
-            header = self.socket.recv(12)
-            if len(header) < 12:
+            hdr_size = _HDR.size
+            if not self._recv_exact(memoryview(self._rx)[:hdr_size]):
                 return None
             
-            length, packet_id, packet_type = struct.unpack('<iii', header)
-            body = self.socket.recv(length - 8)
+            length, packet_id, packet_type = _HDR.unpack_from(self._rx)
+            body_len = length - 8
+            if not 2 <= body_len <= RCON_MAX_REPLY:
+                # The stream can't be trusted past a bad header
+                self.disconnect()
+                return None
+            
+            if hdr_size + body_len <= len(self._rx):
+                view = memoryview(self._rx)[hdr_size:hdr_size + body_len]
+            else:
+                view = memoryview(bytearray(body_len))
+            if not self._recv_exact(view):
+                return None
             
-            return (packet_id, body.decode('utf-8', errors='ignore').rstrip('\x00'))
+            # Body is followed by two NUL terminators
+            return (packet_id, str(view[:body_len - 2], 'utf-8', 'ignore'))
         except:
             return None
     
     def disconnect(self):
         if self.socket:
             self.socket.close()
-            self.socket = None
\ No newline at end of file
+            self.socket = None
+        self.authenticated = False
\ No newline at end of file
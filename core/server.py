@@ -3,17 +3,56 @@ ARK server process management
 """
 
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from utils.validation import validate_path, validate_port, sanitize_input
 
+# Longer mod lists are summarized when echoing the launch command
+MODS_LOG_LIMIT = 50
+
+
+@lru_cache(maxsize=8)
+def _launch_command(
+    server_exe: str,
+    map_name: str,
+    game_port: int,
+    query_port: int,
+    max_players: int,
+    mods: Tuple[str, ...],
+) -> Tuple[str, ...]:
+    """Validate launch arguments and build the command (cached per argument set)"""
+
+    map_name = sanitize_input(map_name, max_length=64)
+    game_port = validate_port(game_port)
+    query_port = validate_port(query_port)
+
+    cmd = [
+        server_exe,
+        f"{map_name}?listen",
+        f"-Port={game_port}",
+        f"-QueryPort={query_port}",
+        f"-MaxPlayers={max_players}",
+        f"-WinLiveMaxPlayers={max_players}",
+        "-server",
+        "-log",
+    ]
+
+    if mods:
+        # Ensure numeric-only mod IDs (security)
+        mod_list = ",".join(str(int(mod_id)) for mod_id in mods)
+        cmd.append(f"-mods={mod_list}")
+
+    return tuple(cmd)
+
 
 class ServerController:
     """Manages ARK server process lifecycle"""
 
-    def __init__(self, server_dir: Path):
-        self.server_dir = validate_path(str(server_dir))
+    def __init__(self, server_dir: Path, *, validated: bool = False):
+        # Callers holding a path from validate_path can skip re-validating it
+        self.server_dir = server_dir if validated else validate_path(str(server_dir))
         self.server_exe = (
             self.server_dir
             / "ShooterGame"
@@ -22,16 +61,41 @@ class ServerController:
             / "ArkAscendedServer.exe"
         )
         self.process: Optional[subprocess.Popen] = None
+        # Only a positive result is cached: the executable can appear at any
+        # time (SteamCMD runs elsewhere) but rarely vanishes while we run
+        self._installed = False
 
     def is_installed(self) -> bool:
-        return self.server_exe.exists()
+        if not self._installed:
+            self._installed = self.server_exe.exists()
+        return self._installed
+
+    def forget_installed(self):
+        """Drop the cached install check, e.g. after SteamCMD modified files"""
+        self._installed = False
 
     def is_running(self) -> bool:
         return self.process is not None and self.process.poll() is None
 
+    def wait_for_exit(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the process to exit; True if it did"""
+        if not self.is_running():
+            return True
+        try:
+            self.process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
     def get_pid(self) -> Optional[int]:
         return self.process.pid if self.process else None
 
+    def get_status(self) -> Tuple[bool, Optional[int]]:
+        """Return (running, pid) from a single poll of the process"""
+        if self.is_running():
+            return True, self.process.pid
+        return False, None
+
     def _build_command(
         self,
         map_name: str,
@@ -47,27 +111,14 @@ class ServerController:
                 f"Server executable not found: {self.server_exe}"
             )
 
-        map_name = sanitize_input(map_name, max_length=64)
-        game_port = validate_port(game_port)
-        query_port = validate_port(query_port)
-
-        cmd = [
+        return list(_launch_command(
             str(self.server_exe),
-            f"{map_name}?listen",
-            f"-Port={game_port}",
-            f"-QueryPort={query_port}",
-            f"-MaxPlayers={max_players}",
-            f"-WinLiveMaxPlayers={max_players}",
-            "-server",
-            "-log",
-        ]
-
-        if mods:
-            # Ensure numeric-only mod IDs (security)
-            mod_list = ",".join(str(int(mod_id)) for mod_id in mods)
-            cmd.append(f"-mods={mod_list}")
-
-        return cmd
+            map_name,
+            game_port,
+            query_port,
+            max_players,
+            tuple(mods or ()),
+        ))
 
     def start(
         self,
@@ -93,7 +144,10 @@ class ServerController:
             )
 
             print("\n=== Starting ARK Server ===")
-            print(f"Command: {' '.join(cmd)}\n")
+            if mods and len(mods) > MODS_LOG_LIMIT:
+                print("Command:", *cmd[:-1], f"-mods=<{len(mods)} ids>", end="\n\n")
+            else:
+                print("Command:", *cmd, end="\n\n")
 
             self.process = subprocess.Popen(
                 cmd,
@@ -105,20 +159,22 @@ class ServerController:
             return True
 
         except Exception as e:
+            self._installed = False
             print(f"ERROR: Failed to start server: {e}")
             return False
 
-    def stop(self) -> bool:
-        """Stop the server gracefully"""
+    def stop(self, timeout: float = 30) -> bool:
+        """Stop the server gracefully, killing it after timeout seconds"""
 
         if not self.is_running():
             print("Server is not running")
             return False
 
         try:
+            self._installed = False
             print("Stopping server gracefully...")
             self.process.terminate()
-            self.process.wait(timeout=30)
+            self.process.wait(timeout=timeout)
 
             print("✓ Server stopped")
             self.process = None
@@ -2,27 +2,49 @@
 SteamCMD integration for server installation and updates
 """
 
+import os
 import subprocess
+import sys
 from pathlib import Path
+from typing import Optional
+from core.server import ServerController
 from utils.validation import validate_path
 from utils.constants import ARK_APP_ID
 
+# SteamCMD output is relayed in raw chunks of this size as it arrives
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _relay_output(proc: subprocess.Popen):
+    """Copy a child's piped stdout to ours without per-line decoding"""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    fd = proc.stdout.fileno()
+    while True:
+        chunk = os.read(fd, STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        out.write(chunk)
+        out.flush()
+    proc.stdout.close()
+
 
 class SteamCMDManager:
     """Manages ARK server installation via SteamCMD"""
     
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, controller: Optional[ServerController] = None):
         self.base_dir = validate_path(str(base_dir))
         self.steamcmd_dir = self.base_dir / "steamcmd"
         self.server_dir = self.base_dir / "server"
         self.steamcmd_exe = self.steamcmd_dir / "steamcmd.exe"
+        # Install checks go through the controller so its cached result is shared
+        self.controller = controller or ServerController(self.server_dir, validated=True)
     
     def is_steamcmd_installed(self) -> bool:
         return self.steamcmd_exe.exists()
     
     def is_server_installed(self) -> bool:
-        server_exe = self.server_dir / "ShooterGame" / "Binaries" / "Win64" / "ArkAscendedServer.exe"
-        return server_exe.exists()
+        return self.controller.is_installed()
     
     def install_or_update(self, force_update: bool = False) -> bool:
         """Install or update ARK server"""
@@ -54,18 +76,35 @@ class SteamCMDManager:
         cmd.append("+quit")
         
         print(f"\n=== Running SteamCMD ===")
-        print(f"Command: {' '.join(cmd)}\n")
+        print("Command:", *cmd, end="\n\n")
         
         try:
-            result = subprocess.run(cmd, cwd=str(self.steamcmd_dir))
+            self.controller.forget_installed()
+            proc = subprocess.Popen(
+                cmd,
+                cwd=str(self.steamcmd_dir),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+            )
+            relayed = False
+            try:
+                _relay_output(proc)
+                relayed = True
+            finally:
+                if not relayed and proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+            returncode = proc.wait()
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("\n✓ SteamCMD completed successfully")
                 if self.is_server_installed():
                     print("✓ Server installation verified")
                 return True
             else:
-                print(f"\nWARNING: SteamCMD returned code {result.returncode}")
+                print(f"\nWARNING: SteamCMD returned code {returncode}")
                 return False
                 
         except Exception as e:
@@ -3,33 +3,263 @@ ARK: Survival Ascended Dedicated Server Manager
 Main entry point and CLI interface
 """
 
+import signal
 import sys
-import time
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
+from typing import Tuple
 
-from core.config import ServerConfig
-from core.steamcmd import SteamCMDManager
+from core.config import ServerConfig, ServerSnapshot
 from core.server import ServerController
-from core.backup import BackupManager
-from core.rcon import RCONClient
-from utils.validation import input_int, input_float, validate_strong_password, sanitize_input
+from utils.validation import validate_strong_password, sanitize_input
 from utils.constants import (
-    DEFAULT_GAME_PORT, DEFAULT_QUERY_PORT, 
+    DEFAULT_GAME_PORT, DEFAULT_QUERY_PORT, DEFAULT_RCON_PORT,
     MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH,
     MAX_SERVER_NAME_LENGTH
 )
 
+_BANNER = "=" * 60
+
+# Seconds a force stop waits after terminating before killing the server
+FORCE_STOP_TIMEOUT = 8
+
+# Seconds to wait for the saveworld reply; large worlds take a while to save
+SAVE_TIMEOUT = 60
+_SUMMARY_HEADER = f"{'Setting':<35} {'Old Value':<20} {'New Value':<20}\n" + "-" * 77
+
+# Accepted answers for y/n prompts
+_YES = frozenset(('y', 'yes', 'true', '1'))
+_NO = frozenset(('n', 'no', 'false', '0'))
+
+# Settings whose values are masked in the change summary
+_PASSWORD_KEYS = frozenset(('server_password', 'admin_password'))
+
+
+def _summarize_password(old, new):
+    return ('*' * len(str(old)) if old else 'none'), ('*' * len(str(new)) if new else 'none')
+
+
+def _summarize_bool(old, new):
+    return ('Yes' if old else 'No'), ('Yes' if new else 'No')
+
+
+def _summarize_float(old, new):
+    # Old values are normally already numbers; only strings need parsing
+    if isinstance(old, (int, float)) and old:
+        old_display = format(old, '.2f')
+    elif isinstance(old, str) and old:
+        try:
+            old_display = format(float(old), '.2f')
+        except ValueError:
+            old_display = "1.00"
+    else:
+        old_display = "1.00"  # Default for new settings
+    return old_display, format(new, '.2f')
+
+
+def _summarize_other(old, new):
+    return (str(old) if old else 'none'), (str(new) if new else 'none')
+
+
+# (old, new) -> display strings, picked by the new value's exact type
+_SUMMARIZERS = {bool: _summarize_bool, float: _summarize_float}
+
+# Display names used by the settings change summary
+_FRIENDLY_NAMES = MappingProxyType({
+    # Initial server settings
+    'server_name': 'Server Name',
+    'max_players': 'Max Players',
+    'server_password': 'Server Password',
+    'admin_password': 'Admin Password',
+    'allow_anyone_baby_imprint': 'Allow Anyone Baby Imprint',
+    'allow_cave_building_pve': 'Allow Cave Building PvE',
+    'allow_flyer_carry_pve': 'Allow Flyer Carry PvE',
+    'always_allow_structure_pickup': 'Always Allow Structure Pickup',
+    'always_notify_player_left': 'Always Notify Player Left',
+    'dino_count_multiplier': 'Dino Count Multiplier',
+    'global_voice_chat': 'Global Voice Chat',
+    'player_stamina_drain': 'Player Stamina Drain',
+    'player_water_drain': 'Player Water Drain',
+    'pve_allow_structures_at_drops': 'PvE Allow Structures At Drops',
+    'random_supply_crate_points': 'Random Supply Crate Points',
+    'show_floating_damage': 'Show Floating Damage Text',
+    'enable_cryopod_nerf': 'Enable Cryopod Nerf',
+    'no_tribute_downloads': 'No Tribute Downloads',
+    'prevent_download_dinos': 'Prevent Download Dinos',
+    'prevent_download_items': 'Prevent Download Items',
+    'prevent_download_survivors': 'Prevent Download Survivors',
+    'prevent_upload_dinos': 'Prevent Upload Dinos',
+    'prevent_upload_items': 'Prevent Upload Items',
+    'prevent_upload_survivors': 'Prevent Upload Survivors',
+    # Multiplier settings
+    'xp_multiplier': 'XP Multiplier',
+    'taming_speed': 'Taming Speed',
+    'harvest_amount': 'Harvest Amount',
+    'baby_cuddle_interval': 'Baby Cuddle Interval',
+    'baby_food_consumption': 'Baby Food Consumption',
+    'baby_imprint_amount': 'Baby Imprint Amount',
+    'baby_mature_speed': 'Baby Mature Speed',
+    'craft_xp': 'Craft XP',
+    'crop_decay_speed': 'Crop Decay Speed',
+    'crop_growth_speed': 'Crop Growth Speed',
+    'egg_hatch_speed': 'Egg Hatch Speed',
+    'generic_xp': 'Generic XP',
+    'harvest_xp': 'Harvest XP',
+    'kill_xp': 'Kill XP',
+    'lay_egg_interval': 'Lay Egg Interval',
+    'mating_interval': 'Mating Interval',
+    'mating_speed': 'Mating Speed',
+    # Difficulty settings
+    'difficulty_offset': 'Difficulty Offset',
+    'override_official_difficulty': 'Override Official Difficulty',
+})
+
+# Values assumed for settings missing from the INI files
+_DEFAULTS = MappingProxyType({
+    'server_name': '',
+    'max_players': 70,
+    'server_password': '',
+    'admin_password': '',
+    'allow_anyone_baby_imprint': False,
+    'allow_cave_building_pve': False,
+    'allow_flyer_carry_pve': False,
+    'always_allow_structure_pickup': False,
+    'always_notify_player_left': False,
+    'dino_count_multiplier': 1.0,
+    'difficulty_offset': 1.0,
+    'override_official_difficulty': 5.0,
+    'global_voice_chat': False,
+    'player_stamina_drain': 1.0,
+    'player_water_drain': 1.0,
+    'pve_allow_structures_at_drops': False,
+    'random_supply_crate_points': False,
+    'show_floating_damage': False,
+    'enable_cryopod_nerf': False,
+    'no_tribute_downloads': False,
+    'prevent_download_dinos': False,
+    'prevent_download_items': False,
+    'prevent_download_survivors': False,
+    'prevent_upload_dinos': False,
+    'prevent_upload_items': False,
+    'prevent_upload_survivors': False,
+    'xp_multiplier': 1.0,
+    'taming_speed': 1.0,
+    'harvest_amount': 1.0,
+    'baby_cuddle_interval': 1.0,
+    'baby_food_consumption': 1.0,
+    'baby_imprint_amount': 1.0,
+    'baby_mature_speed': 1.0,
+    'craft_xp': 1.0,
+    'crop_decay_speed': 1.0,
+    'crop_growth_speed': 1.0,
+    'egg_hatch_speed': 1.0,
+    'generic_xp': 1.0,
+    'harvest_xp': 1.0,
+    'kill_xp': 1.0,
+    'lay_egg_interval': 1.0,
+    'mating_interval': 1.0,
+    'mating_speed': 1.0,
+})
+
+# Options shared by many fields below
+_MULTIPLIER_RANGE = {'min_val': 0.1, 'max_val': 10.0}
+_PASSWORD_INPUT = {'max_length': MAX_PASSWORD_LENGTH, 'sanitizer': sanitize_input}
+
+# (settings key, prompt, input kind, helper options) for configure_initial_server
+_INITIAL_FIELDS = (
+    # Identity and access
+    ('server_name', "Server Name", 'string', {'max_length': MAX_SERVER_NAME_LENGTH, 'sanitizer': sanitize_input}),
+    ('max_players', "Max Players", 'int', {'min_val': 1, 'max_val': 1000}),
+    ('server_password', "Server Password (optional)", 'string', _PASSWORD_INPUT),
+    ('admin_password', "Admin Password (required)", 'string', _PASSWORD_INPUT),
+    # Gameplay toggles
+    ('allow_anyone_baby_imprint', "Allow Anyone Baby Imprint Cuddle?", 'bool', {}),
+    ('allow_cave_building_pve', "Allow Cave Building PvE?", 'bool', {}),
+    ('allow_flyer_carry_pve', "Allow Flyer Carry PvE?", 'bool', {}),
+    ('always_allow_structure_pickup', "Always Allow Structure Pickup?", 'bool', {}),
+    ('always_notify_player_left', "Always Notify Player Left?", 'bool', {}),
+    # World and difficulty
+    ('dino_count_multiplier', "Dino Count Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('difficulty_offset', "Difficulty Offset (ASA default = 1.0)", 'float', {'min_val': 0.01, 'max_val': 1.0}),
+    ('override_official_difficulty', "Override Official Difficulty (MaxLevel ÷ 30, e.g. 6.0 = level 180)", 'float', {'min_val': 1.0, 'max_val': 20.0}),
+    ('global_voice_chat', "Global Voice Chat?", 'bool', {}),
+    # Player multipliers
+    ('player_stamina_drain', "Player Stamina Drain Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('player_water_drain', "Player Water Drain Multiplier", 'float', _MULTIPLIER_RANGE),
+    # More gameplay toggles
+    ('pve_allow_structures_at_drops', "PvE Allow Structures At Supply Drops?", 'bool', {}),
+    ('random_supply_crate_points', "Random Supply Crate Points?", 'bool', {}),
+    ('show_floating_damage', "Show Floating Damage Text?", 'bool', {}),
+    ('enable_cryopod_nerf', "Enable Cryopod Nerf?", 'bool', {}),
+    # Cross-ARK transfers
+    ('no_tribute_downloads', "No Tribute Downloads?", 'bool', {}),
+    ('prevent_download_dinos', "Prevent Download Dinos?", 'bool', {}),
+    ('prevent_download_items', "Prevent Download Items?", 'bool', {}),
+    ('prevent_download_survivors', "Prevent Download Survivors?", 'bool', {}),
+    ('prevent_upload_dinos', "Prevent Upload Dinos?", 'bool', {}),
+    ('prevent_upload_items', "Prevent Upload Items?", 'bool', {}),
+    ('prevent_upload_survivors', "Prevent Upload Survivors?", 'bool', {}),
+)
+
+# (settings key, prompt, input kind, helper options) for configure_server
+_MULTIPLIER_FIELDS = (
+    ('xp_multiplier', "XP Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('taming_speed', "Taming Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('harvest_amount', "Harvest Amount Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('baby_cuddle_interval', "Baby Cuddle Interval Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('baby_food_consumption', "Baby Food Consumption Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('baby_imprint_amount', "Baby Imprint Amount Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('baby_mature_speed', "Baby Mature Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('craft_xp', "Craft XP Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('crop_decay_speed', "Crop Decay Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('crop_growth_speed', "Crop Growth Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('egg_hatch_speed', "Egg Hatch Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('generic_xp', "Generic XP Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('harvest_xp', "Harvest XP Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('kill_xp', "Kill XP Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('lay_egg_interval', "Lay Egg Interval Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('mating_interval', "Mating Interval Multiplier", 'float', _MULTIPLIER_RANGE),
+    ('mating_speed', "Mating Speed Multiplier", 'float', _MULTIPLIER_RANGE),
+)
+
+
+def _ask_yes_no(prompt: str, default: bool = False) -> bool:
+    """Ask a y/n question, returning default for any other answer"""
+    answer = input(prompt).strip().lower()
+    if answer in _YES:
+        return True
+    if answer in _NO:
+        return False
+    return default
+
 
 class ConfigurationHelper:
     """Helper class for handling configuration input and validation"""
     
     def __init__(self, config_manager):
         self.config = config_manager
+        self._is_tty = sys.stdin.isatty()
+        # With both ends piped nobody watches prompts appear, so they can sit
+        # in stdout's buffer and go out in a few large writes
+        self._flush_prompts = sys.stdout.isatty()
+    
+    def _read_line(self, prompt: str) -> str:
+        """Read one answer, skipping readline's editing layer when stdin is piped"""
+        if self._is_tty:
+            return input(prompt)
+        sys.stdout.write(prompt)
+        if self._flush_prompts:
+            sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
     
     def get_string_input(self, prompt: str, current_value: str = "", max_length: int = None, sanitizer=None) -> str:
         """Get string input with validation"""
         display_value = f" [{current_value}]" if current_value else ""
-        user_input = input(f"{prompt}{display_value}: ").strip()
+        user_input = self._read_line(f"{prompt}{display_value}: ").strip()
         
         if user_input:
             if sanitizer:
@@ -42,10 +272,11 @@ class ConfigurationHelper:
     
     def get_int_input(self, prompt: str, current_value: int, min_val: int = None, max_val: int = None) -> int:
         """Get integer input with validation"""
+        display_value = f" [{current_value}]" if current_value is not None else ""
+        full_prompt = f"{prompt}{display_value}: "
         while True:
             try:
-                display_value = f" [{current_value}]" if current_value is not None else ""
-                user_input = input(f"{prompt}{display_value}: ").strip()
+                user_input = self._read_line(full_prompt).strip()
                 
                 if not user_input:
                     return current_value
@@ -63,10 +294,11 @@ class ConfigurationHelper:
     
     def get_float_input(self, prompt: str, current_value: float, min_val: float = None, max_val: float = None) -> float:
         """Get float input with validation"""
+        display_value = f" [{current_value}]" if current_value is not None else ""
+        full_prompt = f"{prompt}{display_value}: "
         while True:
             try:
-                display_value = f" [{current_value}]" if current_value is not None else ""
-                user_input = input(f"{prompt}{display_value}: ").strip()
+                user_input = self._read_line(full_prompt).strip()
                 
                 if not user_input:
                     return current_value
@@ -84,143 +316,163 @@ class ConfigurationHelper:
     
     def get_bool_input(self, prompt: str, current_value: bool) -> bool:
         """Get boolean input with validation"""
-        display_value = "y" if current_value else "n"
+        full_prompt = f"{prompt} (y/n) [{'y' if current_value else 'n'}]: "
         while True:
-            user_input = input(f"{prompt} (y/n) [{display_value}]: ").lower().strip()
+            user_input = self._read_line(full_prompt).strip().lower()
             
             if not user_input:
                 return current_value
             
-            if user_input in ['y', 'yes']:
+            if user_input in _YES:
                 return True
-            elif user_input in ['n', 'no']:
+            elif user_input in _NO:
                 return False
             else:
                 print("Please enter 'y' or 'n'")
+    
+    _KIND_METHODS = {
+        'string': get_string_input,
+        'int': get_int_input,
+        'float': get_float_input,
+        'bool': get_bool_input,
+    }
+    
+    def get_input(self, kind: str, prompt: str, current_value, **options):
+        """Prompt using the input method for kind ('string', 'int', 'float' or 'bool')"""
+        return self._KIND_METHODS[kind](self, prompt, current_value, **options)
 
 
 class ServerManager:
     """Main server manager interface"""
     
+    # Menu choice -> handler method name
+    _DISPATCH = {
+        '1': 'install_update_server',
+        '2': 'configure_initial_server',
+        '3': 'configure_server',
+        '4': 'manage_mods',
+        '5': 'start_server',
+        '6': 'stop_server',
+        '7': 'show_status',
+        '8': 'create_backup',
+        '9': 'rcon_console',
+        '10': 'view_logs',
+        '11': 'force_stop_server',
+        '0': '_shutdown',
+    }
+    
+    # Main menu, rendered once and written with a single call
+    _MENU_TEXT = (
+        "\n" + _BANNER + "\n"
+        "ARK: Survival Ascended Server Manager\n"
+        + _BANNER + "\n"
+        "1. Install/Update Server\n"
+        "2. Initial Server Settings\n"
+        "3. Configure Server (Frequent Multipliers)\n"
+        "4. Manage Mods\n"
+        "5. Start Server\n"
+        "6. Stop Server (saveworld + doexit)\n"
+        "7. Server Status\n"
+        "8. Create Backup\n"
+        "9. RCON Console\n"
+        "10. View Logs\n"
+        "11. Force Stop Server (no save)\n"
+        "0. Exit\n"
+        + _BANNER + "\n"
+    )
+    
+    _MODS_MENU_TEXT = (
+        "\nOptions:\n"
+        "1. Add/Replace mods\n"
+        "2. Remove all mods\n"
+        "3. Cancel\n"
+    )
+    
+    _RCON_HELP_TEXT = (
+        "Connection failed. Ensure:\n"
+        "  1. Server is running\n"
+        "  2. RCON is enabled in server settings\n"
+        "  3. Password is correct\n"
+    )
+    
     def __init__(self, base_dir: str = "./ArkServerManager"):
         self.base_dir = Path(base_dir).resolve()
         self.base_dir.mkdir(parents=True, exist_ok=True)
         
-        self.steamcmd = SteamCMDManager(self.base_dir)
-        self.config = ServerConfig(self.steamcmd.server_dir)
-        self.controller = ServerController(self.steamcmd.server_dir)
-        self.backup = BackupManager(self.steamcmd.server_dir, self.base_dir)
-        self.rcon = RCONClient()
-        self.config_helper = ConfigurationHelper(self.config)
+        self.server_dir = self.base_dir / "server"
+        # server_dir is derived from the already resolved base_dir
+        self.config = ServerConfig(self.server_dir, validated=True)
+        self.controller = ServerController(self.server_dir, validated=True)
+        self.rcon = None
+        # Scripted (piped) sessions skip the "Press Enter" pauses
+        self._interactive = sys.stdin.isatty()
+        # Menu choice -> bound handler, resolved once
+        self._menu = {choice: getattr(self, name) for choice, name in self._DISPATCH.items()}
+    
+    # Subsystems only some menu actions need are imported and built on first use
+    @cached_property
+    def steamcmd(self):
+        from core.steamcmd import SteamCMDManager
+        return SteamCMDManager(self.base_dir, controller=self.controller)
+    
+    @cached_property
+    def backup(self):
+        from core.backup import BackupManager
+        return BackupManager(self.server_dir, self.base_dir)
+    
+    @cached_property
+    def config_helper(self) -> ConfigurationHelper:
+        return ConfigurationHelper(self.config)
+    
+    def _snapshot(self) -> ServerSnapshot:
+        """Get the current config, parsing the INI files only after changes"""
+        # ServerConfig revalidates against each file's mtime and size, so hand
+        # edits made while the manager is open are picked up
+        return self.config.snapshot()
+    
+    def _prompt_fields(self, fields, current_values: dict) -> dict:
+        """Prompt for each (key, prompt, kind, options) field, returning only changed values"""
+        changed = {}
+        # Bound once; the loop runs per field of a 20-30 row table
+        get_input = self.config_helper.get_input
+        get_current = current_values.__getitem__
+        for key, prompt, kind, options in fields:
+            current = get_current(key)
+            value = get_input(kind, prompt, current, **options)
+            if value != current:
+                changed[key] = value
+        return changed
     
     def _display_settings_summary(self, settings: dict, old_settings: dict, title: str):
         """Display a formatted summary of settings changes"""
         if not settings:
             return
-            
-        print(f"\n=== {title} ===")
-        print(f"{'Setting':<35} {'Old Value':<20} {'New Value':<20}")
-        print("-" * 77)
-        
-        # Mapping for user-friendly names (shared between methods)
-        friendly_names = {
-            # Initial server settings
-            'server_name': 'Server Name',
-            'max_players': 'Max Players',
-            'server_password': 'Server Password',
-            'admin_password': 'Admin Password',
-            'allow_anyone_baby_imprint': 'Allow Anyone Baby Imprint',
-            'allow_cave_building_pve': 'Allow Cave Building PvE',
-            'allow_flyer_carry_pve': 'Allow Flyer Carry PvE',
-            'always_allow_structure_pickup': 'Always Allow Structure Pickup',
-            'always_notify_player_left': 'Always Notify Player Left',
-            'dino_count_multiplier': 'Dino Count Multiplier',
-            'global_voice_chat': 'Global Voice Chat',
-            'player_stamina_drain': 'Player Stamina Drain',
-            'player_water_drain': 'Player Water Drain',
-            'pve_allow_structures_at_drops': 'PvE Allow Structures At Drops',
-            'random_supply_crate_points': 'Random Supply Crate Points',
-            'show_floating_damage': 'Show Floating Damage Text',
-            'enable_cryopod_nerf': 'Enable Cryopod Nerf',
-            'no_tribute_downloads': 'No Tribute Downloads',
-            'prevent_download_dinos': 'Prevent Download Dinos',
-            'prevent_download_items': 'Prevent Download Items',
-            'prevent_download_survivors': 'Prevent Download Survivors',
-            'prevent_upload_dinos': 'Prevent Upload Dinos',
-            'prevent_upload_items': 'Prevent Upload Items',
-            'prevent_upload_survivors': 'Prevent Upload Survivors',
-            # Multiplier settings
-            'xp_multiplier': 'XP Multiplier',
-            'taming_speed': 'Taming Speed',
-            'harvest_amount': 'Harvest Amount',
-            'baby_cuddle_interval': 'Baby Cuddle Interval',
-            'baby_food_consumption': 'Baby Food Consumption',
-            'baby_imprint_amount': 'Baby Imprint Amount',
-            'baby_mature_speed': 'Baby Mature Speed',
-            'craft_xp': 'Craft XP',
-            'crop_decay_speed': 'Crop Decay Speed',
-            'crop_growth_speed': 'Crop Growth Speed',
-            'egg_hatch_speed': 'Egg Hatch Speed',
-            'generic_xp': 'Generic XP',
-            'harvest_xp': 'Harvest XP',
-            'kill_xp': 'Kill XP',
-            'lay_egg_interval': 'Lay Egg Interval',
-            'mating_interval': 'Mating Interval',
-            'mating_speed': 'Mating Speed',
-            # Difficulty settings
-            'difficulty_offset': 'Difficulty Offset',
-            'override_official_difficulty': 'Override Official Difficulty',
-        }
         
+        if not sys.stdout.isatty():
+            # Headless runs get one parseable line instead of the table
+            import json
+            changes = {key: ('*' * len(str(value)) if key in _PASSWORD_KEYS else str(value))
+                       for key, value in settings.items()}
+            sys.stdout.write(json.dumps({'title': title, 'changes': changes}) + "\n")
+            return
+        
+        lines = [f"\n=== {title} ===", _SUMMARY_HEADER]
         for key, new_value in settings.items():
             old_value = old_settings.get(key, '')
             
-            # Handle password masking
-            if 'password' in key:
-                if old_value:
-                    old_display = '*' * len(str(old_value))
-                else:
-                    old_display = 'none'
-                if new_value:
-                    new_display = '*' * len(str(new_value))
-                else:
-                    new_display = 'none'
-            # Handle boolean values
-            elif isinstance(new_value, bool):
-                old_display = 'Yes' if old_value else 'No'
-                new_display = 'Yes' if new_value else 'No'
-            # Handle float values
-            elif isinstance(new_value, float):
-                try:
-                    old_float = float(old_value) if old_value else 1.0
-                    old_display = f"{old_float:.2f}"
-                except (ValueError, TypeError):
-                    old_display = "1.00"  # Default for new settings
-                new_display = f"{new_value:.2f}"
-            # Handle other values
+            if key in _PASSWORD_KEYS:
+                summarize = _summarize_password
             else:
-                old_display = str(old_value) if old_value else 'none'
-                new_display = str(new_value) if new_value else 'none'
+                summarize = _SUMMARIZERS.get(type(new_value), _summarize_other)
+            old_display, new_display = summarize(old_value, new_value)
             
-            friendly_name = friendly_names.get(key, key.replace('_', ' ').title())
-            print(f"{friendly_name:<35} {old_display:<20} {new_display:<20}")
+            friendly_name = _FRIENDLY_NAMES.get(key, key.replace('_', ' ').title())
+            lines.append(f"{friendly_name:<35} {old_display:<20} {new_display:<20}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def show_menu(self):
-        print("\n" + "="*60)
-        print("ARK: Survival Ascended Server Manager")
-        print("="*60)
-        print("1. Install/Update Server")
-        print("2. Initial Server Settings")
-        print("3. Configure Server (Frequent Multipliers)")
-        print("4. Manage Mods")
-        print("5. Start Server")
-        print("6. Stop Server (saveworld + doexit)")
-        print("7. Server Status")
-        print("8. Create Backup")
-        print("9. RCON Console")
-        print("10. View Logs")
-        print("0. Exit")
-        print("="*60)
+        sys.stdout.write(self._MENU_TEXT)
     
     def run(self):
         print("\nWelcome to ARK Server Manager")
@@ -228,228 +480,43 @@ class ServerManager:
         
         while True:
             self.show_menu()
-            choice = input("\nSelect option: ").strip()
+            # Interned so the menu lookup can match on identity
+            choice = sys.intern(input("\nSelect option: ").strip())
             
-            if choice == '1':
-                self.install_update_server()
-            elif choice == '2':
-                self.configure_initial_server()
-            elif choice == '3':
-                self.configure_server()
-            elif choice == '4':
-                self.manage_mods()
-            elif choice == '5':
-                self.start_server()
-            elif choice == '6':
-                self.stop_server()
-            elif choice == '7':
-                self.show_status()
-            elif choice == '8':
-                self.backup.create_backup()
-            elif choice == '9':
-                self.rcon_console()
-            elif choice == '10':
-                self.view_logs()
-            elif choice == '0':
-                self._shutdown()
-                break
-            else:
+            handler = self._menu.get(choice)
+            if handler is None:
                 print("Invalid option")
+            else:
+                handler()
+                if choice == '0':
+                    break
             
-            input("\nPress Enter to continue...")
+            if self._interactive:
+                input("\nPress Enter to continue...")
     
     def install_update_server(self):
         """Install or update server"""
         print("\n=== Install/Update Server ===")
-        force = input("Force validate? (y/n): ").lower() == 'y'
+        force = _ask_yes_no("Force validate? (y/n): ")
         self.steamcmd.install_or_update(force_update=force)
 
+    def create_backup(self):
+        """Create a backup of server save data"""
+        print("\n=== Create Backup ===")
+        compress = _ask_yes_no("Compress into a single archive? (y/n): ")
+        self.backup.create_backup(compress=compress)
+
     def configure_initial_server(self):
         print("\n=== Initial Server Settings (One-time Setup) ===")
         print("These settings are typically set once and rarely changed.")
         
-        current_settings = self.config.get_server_settings()
-        settings = {}
-        
-        # Server name
-        settings['server_name'] = self.config_helper.get_string_input(
-            "Server Name", current_settings.get('server_name', ''), 
-            max_length=MAX_SERVER_NAME_LENGTH, sanitizer=sanitize_input
-        )
-        if settings['server_name'] == current_settings.get('server_name', ''):
-            del settings['server_name']
-        
-        # Max players
-        settings['max_players'] = self.config_helper.get_int_input(
-            "Max Players", current_settings.get('max_players', 70), min_val=1, max_val=1000
-        )
-        if settings['max_players'] == current_settings.get('max_players', 70):
-            del settings['max_players']
-        
-        # Server password
-        settings['server_password'] = self.config_helper.get_string_input(
-            "Server Password (optional)", current_settings.get('server_password', ''), 
-            max_length=MAX_PASSWORD_LENGTH, sanitizer=sanitize_input
-        )
-        if settings['server_password'] == current_settings.get('server_password', ''):
-            del settings['server_password']
-        
-        # Admin password
-        settings['admin_password'] = self.config_helper.get_string_input(
-            "Admin Password (required)", current_settings.get('admin_password', ''), 
-            max_length=MAX_PASSWORD_LENGTH, sanitizer=sanitize_input
-        )
-        if settings['admin_password'] == current_settings.get('admin_password', ''):
-            del settings['admin_password']
-        
-        # Boolean settings
-        settings['allow_anyone_baby_imprint'] = self.config_helper.get_bool_input(
-            "Allow Anyone Baby Imprint Cuddle?", current_settings.get('allow_anyone_baby_imprint', False)
-        )
-        if settings['allow_anyone_baby_imprint'] == current_settings.get('allow_anyone_baby_imprint', False):
-            del settings['allow_anyone_baby_imprint']
-        
-        settings['allow_cave_building_pve'] = self.config_helper.get_bool_input(
-            "Allow Cave Building PvE?", current_settings.get('allow_cave_building_pve', False)
-        )
-        if settings['allow_cave_building_pve'] == current_settings.get('allow_cave_building_pve', False):
-            del settings['allow_cave_building_pve']
-        
-        settings['allow_flyer_carry_pve'] = self.config_helper.get_bool_input(
-            "Allow Flyer Carry PvE?", current_settings.get('allow_flyer_carry_pve', False)
-        )
-        if settings['allow_flyer_carry_pve'] == current_settings.get('allow_flyer_carry_pve', False):
-            del settings['allow_flyer_carry_pve']
-        
-        settings['always_allow_structure_pickup'] = self.config_helper.get_bool_input(
-            "Always Allow Structure Pickup?", current_settings.get('always_allow_structure_pickup', False)
-        )
-        if settings['always_allow_structure_pickup'] == current_settings.get('always_allow_structure_pickup', False):
-            del settings['always_allow_structure_pickup']
-        
-        settings['always_notify_player_left'] = self.config_helper.get_bool_input(
-            "Always Notify Player Left?", current_settings.get('always_notify_player_left', False)
-        )
-        if settings['always_notify_player_left'] == current_settings.get('always_notify_player_left', False):
-            del settings['always_notify_player_left']
-        
-        # Dino count multiplier
-        settings['dino_count_multiplier'] = self.config_helper.get_float_input(
-            "Dino Count Multiplier", current_settings.get('dino_count_multiplier', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['dino_count_multiplier'] == current_settings.get('dino_count_multiplier', 1.0):
-            del settings['dino_count_multiplier']
-        
-        # Difficulty Offset
-        settings['difficulty_offset'] = self.config_helper.get_float_input(
-            "Difficulty Offset (ASA default = 1.0)",
-            current_settings.get('difficulty_offset', 1.0),
-            min_val=0.01,
-            max_val=1.0
-        )
-        if settings['difficulty_offset'] == current_settings.get('difficulty_offset', 1.0):
-            del settings['difficulty_offset']
-
-        # Override Official Difficulty
-        settings['override_official_difficulty'] = self.config_helper.get_float_input(
-            "Override Official Difficulty (MaxLevel ÷ 30, e.g. 6.0 = level 180)",
-            current_settings.get('override_official_difficulty', 5.0),
-            min_val=1.0,
-            max_val=20.0
-        )
-        if settings['override_official_difficulty'] == current_settings.get('override_official_difficulty', 5.0):
-            del settings['override_official_difficulty']
-
-        # Global voice chat
-        settings['global_voice_chat'] = self.config_helper.get_bool_input(
-            "Global Voice Chat?", current_settings.get('global_voice_chat', False)
-        )
-        if settings['global_voice_chat'] == current_settings.get('global_voice_chat', False):
-            del settings['global_voice_chat']
-        
-        # Player multipliers
-        settings['player_stamina_drain'] = self.config_helper.get_float_input(
-            "Player Stamina Drain Multiplier", current_settings.get('player_stamina_drain', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['player_stamina_drain'] == current_settings.get('player_stamina_drain', 1.0):
-            del settings['player_stamina_drain']
-        
-        settings['player_water_drain'] = self.config_helper.get_float_input(
-            "Player Water Drain Multiplier", current_settings.get('player_water_drain', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['player_water_drain'] == current_settings.get('player_water_drain', 1.0):
-            del settings['player_water_drain']
-        
-        # More boolean settings
-        settings['pve_allow_structures_at_drops'] = self.config_helper.get_bool_input(
-            "PvE Allow Structures At Supply Drops?", current_settings.get('pve_allow_structures_at_drops', False)
-        )
-        if settings['pve_allow_structures_at_drops'] == current_settings.get('pve_allow_structures_at_drops', False):
-            del settings['pve_allow_structures_at_drops']
-        
-        settings['random_supply_crate_points'] = self.config_helper.get_bool_input(
-            "Random Supply Crate Points?", current_settings.get('random_supply_crate_points', False)
-        )
-        if settings['random_supply_crate_points'] == current_settings.get('random_supply_crate_points', False):
-            del settings['random_supply_crate_points']
-        
-        settings['show_floating_damage'] = self.config_helper.get_bool_input(
-            "Show Floating Damage Text?", current_settings.get('show_floating_damage', False)
-        )
-        if settings['show_floating_damage'] == current_settings.get('show_floating_damage', False):
-            del settings['show_floating_damage']
-        
-        settings['enable_cryopod_nerf'] = self.config_helper.get_bool_input(
-            "Enable Cryopod Nerf?", current_settings.get('enable_cryopod_nerf', False)
-        )
-        if settings['enable_cryopod_nerf'] == current_settings.get('enable_cryopod_nerf', False):
-            del settings['enable_cryopod_nerf']
-        
-        # Upload/download prevention settings
-        settings['no_tribute_downloads'] = self.config_helper.get_bool_input(
-            "No Tribute Downloads?", current_settings.get('no_tribute_downloads', False)
-        )
-        if settings['no_tribute_downloads'] == current_settings.get('no_tribute_downloads', False):
-            del settings['no_tribute_downloads']
-        
-        settings['prevent_download_dinos'] = self.config_helper.get_bool_input(
-            "Prevent Download Dinos?", current_settings.get('prevent_download_dinos', False)
-        )
-        if settings['prevent_download_dinos'] == current_settings.get('prevent_download_dinos', False):
-            del settings['prevent_download_dinos']
-        
-        settings['prevent_download_items'] = self.config_helper.get_bool_input(
-            "Prevent Download Items?", current_settings.get('prevent_download_items', False)
-        )
-        if settings['prevent_download_items'] == current_settings.get('prevent_download_items', False):
-            del settings['prevent_download_items']
-        
-        settings['prevent_download_survivors'] = self.config_helper.get_bool_input(
-            "Prevent Download Survivors?", current_settings.get('prevent_download_survivors', False)
-        )
-        if settings['prevent_download_survivors'] == current_settings.get('prevent_download_survivors', False):
-            del settings['prevent_download_survivors']
-        
-        settings['prevent_upload_dinos'] = self.config_helper.get_bool_input(
-            "Prevent Upload Dinos?", current_settings.get('prevent_upload_dinos', False)
-        )
-        if settings['prevent_upload_dinos'] == current_settings.get('prevent_upload_dinos', False):
-            del settings['prevent_upload_dinos']
-        
-        settings['prevent_upload_items'] = self.config_helper.get_bool_input(
-            "Prevent Upload Items?", current_settings.get('prevent_upload_items', False)
-        )
-        if settings['prevent_upload_items'] == current_settings.get('prevent_upload_items', False):
-            del settings['prevent_upload_items']
-        
-        settings['prevent_upload_survivors'] = self.config_helper.get_bool_input(
-            "Prevent Upload Survivors?", current_settings.get('prevent_upload_survivors', False)
-        )
-        if settings['prevent_upload_survivors'] == current_settings.get('prevent_upload_survivors', False):
-            del settings['prevent_upload_survivors']
+        current_settings = {**_DEFAULTS, **self._snapshot().settings}
+        settings = self._prompt_fields(_INITIAL_FIELDS, current_settings)
         
         if settings:
-            self.config.update_game_settings(settings)
+            if not self.config.apply_changes(settings):
+                print("ERROR: Initial server settings were not saved")
+                return
             
             # Display summary of changes
             self._display_settings_summary(settings, current_settings, "Initial Settings Modified")
@@ -462,159 +529,18 @@ class ServerManager:
         print("\n=== Configure Server (Frequent Multipliers) ===")
         print("Current values shown in brackets. Press Enter to keep current value.")
         
-        current_settings = self.config.get_server_settings()
-        current_stats = self.config.get_stat_multipliers()
-        settings = {}
-        
-        # XP Multiplier
-        settings['xp_multiplier'] = self.config_helper.get_float_input(
-            "XP Multiplier", current_settings.get('xp_multiplier', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['xp_multiplier'] == current_settings.get('xp_multiplier', 1.0):
-            del settings['xp_multiplier']
-        
-        # Taming Speed
-        settings['taming_speed'] = self.config_helper.get_float_input(
-            "Taming Speed Multiplier", current_settings.get('taming_speed', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['taming_speed'] == current_settings.get('taming_speed', 1.0):
-            del settings['taming_speed']
-        
-        # Harvest Amount
-        settings['harvest_amount'] = self.config_helper.get_float_input(
-            "Harvest Amount Multiplier", current_settings.get('harvest_amount', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['harvest_amount'] == current_settings.get('harvest_amount', 1.0):
-            del settings['harvest_amount']
-        
-        # Baby Cuddle Interval
-        settings['baby_cuddle_interval'] = self.config_helper.get_float_input(
-            "Baby Cuddle Interval Multiplier", current_stats.get('baby_cuddle_interval', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['baby_cuddle_interval'] == current_stats.get('baby_cuddle_interval', 1.0):
-            del settings['baby_cuddle_interval']
-        
-        # Baby Food Consumption
-        settings['baby_food_consumption'] = self.config_helper.get_float_input(
-            "Baby Food Consumption Speed Multiplier", current_stats.get('baby_food_consumption', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['baby_food_consumption'] == current_stats.get('baby_food_consumption', 1.0):
-            del settings['baby_food_consumption']
-        
-        # Baby Imprint Amount
-        settings['baby_imprint_amount'] = self.config_helper.get_float_input(
-            "Baby Imprint Amount Multiplier", current_stats.get('baby_imprint_amount', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['baby_imprint_amount'] == current_stats.get('baby_imprint_amount', 1.0):
-            del settings['baby_imprint_amount']
-        
-        # Baby Mature Speed
-        settings['baby_mature_speed'] = self.config_helper.get_float_input(
-            "Baby Mature Speed Multiplier", current_stats.get('baby_mature_speed', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['baby_mature_speed'] == current_stats.get('baby_mature_speed', 1.0):
-            del settings['baby_mature_speed']
-        
-        # Craft XP
-        settings['craft_xp'] = self.config_helper.get_float_input(
-            "Craft XP Multiplier", current_stats.get('craft_xp', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['craft_xp'] == current_stats.get('craft_xp', 1.0):
-            del settings['craft_xp']
-        
-        # Crop Decay Speed
-        settings['crop_decay_speed'] = self.config_helper.get_float_input(
-            "Crop Decay Speed Multiplier", current_stats.get('crop_decay_speed', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['crop_decay_speed'] == current_stats.get('crop_decay_speed', 1.0):
-            del settings['crop_decay_speed']
-        
-        # Crop Growth Speed
-        settings['crop_growth_speed'] = self.config_helper.get_float_input(
-            "Crop Growth Speed Multiplier", current_stats.get('crop_growth_speed', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['crop_growth_speed'] == current_stats.get('crop_growth_speed', 1.0):
-            del settings['crop_growth_speed']
-        
-        # Egg Hatch Speed
-        settings['egg_hatch_speed'] = self.config_helper.get_float_input(
-            "Egg Hatch Speed Multiplier", current_stats.get('egg_hatch_speed', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['egg_hatch_speed'] == current_stats.get('egg_hatch_speed', 1.0):
-            del settings['egg_hatch_speed']
-        
-        # Generic XP
-        settings['generic_xp'] = self.config_helper.get_float_input(
-            "Generic XP Multiplier", current_stats.get('generic_xp', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['generic_xp'] == current_stats.get('generic_xp', 1.0):
-            del settings['generic_xp']
-        
-        # Harvest XP
-        settings['harvest_xp'] = self.config_helper.get_float_input(
-            "Harvest XP Multiplier", current_stats.get('harvest_xp', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['harvest_xp'] == current_stats.get('harvest_xp', 1.0):
-            del settings['harvest_xp']
-        
-        # Kill XP
-        settings['kill_xp'] = self.config_helper.get_float_input(
-            "Kill XP Multiplier", current_stats.get('kill_xp', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['kill_xp'] == current_stats.get('kill_xp', 1.0):
-            del settings['kill_xp']
-        
-        # Lay Egg Interval
-        settings['lay_egg_interval'] = self.config_helper.get_float_input(
-            "Lay Egg Interval Multiplier", current_stats.get('lay_egg_interval', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['lay_egg_interval'] == current_stats.get('lay_egg_interval', 1.0):
-            del settings['lay_egg_interval']
-        
-        # Mating Interval
-        settings['mating_interval'] = self.config_helper.get_float_input(
-            "Mating Interval Multiplier", current_stats.get('mating_interval', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['mating_interval'] == current_stats.get('mating_interval', 1.0):
-            del settings['mating_interval']
-        
-        # Mating Speed
-        settings['mating_speed'] = self.config_helper.get_float_input(
-            "Mating Speed Multiplier", current_stats.get('mating_speed', 1.0), min_val=0.1, max_val=10.0
-        )
-        if settings['mating_speed'] == current_stats.get('mating_speed', 1.0):
-            del settings['mating_speed']
+        snapshot = self._snapshot()
+        current_values = {**_DEFAULTS, **snapshot.settings, **snapshot.stats}
+        settings = self._prompt_fields(_MULTIPLIER_FIELDS, current_values)
         
         if settings:
-            # Split settings between GameUserSettings.ini and Game.ini
-            game_user_settings = {}
-            game_ini_settings = {}
-            
-            # GameUserSettings.ini settings
-            if 'xp_multiplier' in settings:
-                game_user_settings['xp_multiplier'] = settings['xp_multiplier']
-            if 'taming_speed' in settings:
-                game_user_settings['taming_speed'] = settings['taming_speed']
-            if 'harvest_amount' in settings:
-                game_user_settings['harvest_amount'] = settings['harvest_amount']
-            
-            # Game.ini settings (all the multipliers)
-            game_ini_keys = [
-                'baby_cuddle_interval', 'baby_food_consumption', 'baby_imprint_amount', 'baby_mature_speed',
-                'craft_xp', 'crop_decay_speed', 'crop_growth_speed', 'egg_hatch_speed', 'generic_xp',
-                'harvest_xp', 'kill_xp', 'lay_egg_interval', 'mating_interval', 'mating_speed'
-            ]
-            for key in game_ini_keys:
-                if key in settings:
-                    game_ini_settings[key] = settings[key]
-            
-            if game_user_settings:
-                self.config.update_game_settings(game_user_settings)
-            if game_ini_settings:
-                self.config.update_stat_multipliers(game_ini_settings)
+            # Multipliers span GameUserSettings.ini and Game.ini
+            if not self.config.apply_changes(settings):
+                print("ERROR: Server settings were not saved")
+                return
             
             # Display summary of changes
-            self._display_settings_summary(settings, {**current_settings, **current_stats}, "Settings Modified")
+            self._display_settings_summary(settings, current_values, "Settings Modified")
             
             print("\n✓ Server settings updated")
         else:
@@ -627,56 +553,57 @@ class ServerManager:
             return
         
         # Get server settings for startup
-        settings = self.config.get_server_settings()
-        server_name = self.config.get_server_name()
+        snapshot = self._snapshot()
+        settings = snapshot.settings
+        server_name = snapshot.server_name
         
         map_name = settings.get('map_name', 'TheIsland_WP')
-        game_port = settings.get('game_port', 7777)
-        query_port = settings.get('query_port', 27015)
+        game_port = settings.get('game_port', DEFAULT_GAME_PORT)
+        query_port = settings.get('query_port', DEFAULT_QUERY_PORT)
         max_players = settings.get('max_players', 10)
-        mods = self.config.get_active_mods()
+        mods = list(snapshot.active_mods)
 
         print(f"Starting server: {server_name}")
         print(f"Map: {map_name}, Port: {game_port}, Max Players: {max_players}")
         
         self.controller.start(map_name, game_port, query_port, max_players, mods=mods)
     
-    def stop_server(self):
+    def stop_server(self, fast: bool = False):
         """Save the world and then stop the server gracefully"""
         if not self.controller.is_running():
             print("Server is not running")
             return
         
+        if fast:
+            # Skip the RCON save entirely and just signal the process
+            self.controller.stop(timeout=FORCE_STOP_TIMEOUT)
+            return
+        
         print("Saving world before shutdown...")
         
         # Try to save and stop via RCON
-        settings = self.config.get_server_settings()
-        rcon_port = settings.get('rcon_port', 27020)
-        admin_password = settings.get('admin_password', '')
+        rcon_port, admin_password = self._rcon_credentials()
         
         if admin_password:
-            self.rcon = RCONClient(port=rcon_port, password=admin_password)
-            if self.rcon.connect():
-                # Send save command
-                save_response = self.rcon.send_command("saveworld")
+            rcon = self._get_rcon(admin_password, rcon_port)
+            if rcon:
+                try:
+                    # Save and shutdown go out in one write; the server runs RCON
+                    # commands in order, so doexit only executes once the save is done
+                    save_response, exit_response = rcon.send_commands(["saveworld", "doexit"], timeout=SAVE_TIMEOUT)
+                finally:
+                    # The server is going away either way
+                    rcon.disconnect()
+                
                 if save_response:
                     print("✓ World saved successfully")
                 else:
                     print("WARNING: Could not save world via RCON")
                 
-                # Wait a moment for save to complete
-                time.sleep(5)
-                
-                # Send graceful shutdown command
-                exit_response = self.rcon.send_command("doexit")
                 if exit_response:
                     print("✓ Server shutdown command sent via RCON")
                     # Wait for server to shut down
-                    time.sleep(10)
-                    self.rcon.disconnect()
-                    
-                    # Check if process is still running
-                    if self.controller.is_running():
+                    if not self.controller.wait_for_exit(10):
                         print("WARNING: Server still running after doexit, terminating process...")
                         self.controller.stop()
                     else:
@@ -685,7 +612,6 @@ class ServerManager:
                     return
                 else:
                     print("WARNING: Could not send shutdown command via RCON")
-                self.rcon.disconnect()
             else:
                 print("WARNING: Could not connect to RCON. Server will be stopped by terminating process.")
         else:
@@ -694,19 +620,17 @@ class ServerManager:
         # Fallback: terminate process
         self.controller.stop()
     
+    def force_stop_server(self):
+        """Stop the server without saving the world first"""
+        self.stop_server(fast=True)
+    
     def manage_mods(self):
-        print("\n=== Mod Management ===")
-        
-        current_mods = self.config.get_active_mods()
+        current_mods = self._snapshot().active_mods
         if current_mods:
-            print(f"Current mods: {', '.join(current_mods)}")
+            mods_line = f"Current mods: {', '.join(current_mods)}"
         else:
-            print("No mods currently active")
-        
-        print("\nOptions:")
-        print("1. Add/Replace mods")
-        print("2. Remove all mods")
-        print("3. Cancel")
+            mods_line = "No mods currently active"
+        sys.stdout.write(f"\n=== Mod Management ===\n{mods_line}\n{self._MODS_MENU_TEXT}")
         
         choice = input("\nChoice: ").strip()
         
@@ -715,38 +639,40 @@ class ServerManager:
             mod_input = input("Mod IDs: ")
             
             if mod_input:
-                mod_ids = [m.strip() for m in mod_input.split(',')]
-                if self.config.set_mods(mod_ids):
+                # set_mods strips and validates each ID itself
+                if self.config.set_mods(mod_input.split(',')):
                     print("NOTE: Server restart required for mod changes")
         
         elif choice == '2':
-            confirm = input("Remove all mods? (y/n): ").lower()
-            if confirm == 'y':
-                self.config.clear_mods()
-                print("NOTE: Server restart required for mod changes")
+            if _ask_yes_no("Remove all mods? (y/n): "):
+                if self.config.clear_mods():
+                    print("NOTE: Server restart required for mod changes")
         
         else:
             print("Cancelled")
     
     def show_status(self):
-        print("\n=== Server Status ===")
-        print(f"Server installed: {self.controller.is_installed()}")
-        print(f"Server running: {self.controller.is_running()}")
+        running, pid = self.controller.get_status()
+        lines = [
+            "\n=== Server Status ===",
+            f"Server installed: {self.controller.is_installed()}",
+            f"Server running: {running}",
+        ]
         
-        if self.controller.is_running():
-            print(f"Process ID: {self.controller.get_pid()}")
+        if running:
+            lines.append(f"Process ID: {pid}")
         
-        mods = self.config.get_active_mods()
+        mods = self._snapshot().active_mods
         if mods:
-            print(f"Active mods: {', '.join(mods)}")
+            lines.append(f"Active mods: {', '.join(mods)}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def rcon_console(self):
-        print("\n=== RCON Console ===")
-        print("WARNING: RCON must be enabled in server settings")
+        sys.stdout.write("\n=== RCON Console ===\nWARNING: RCON must be enabled in server settings\n")
         
         # Get configured admin password
-        settings = self.config.get_server_settings()
-        admin_password = settings.get('admin_password', '')
+        rcon_port, admin_password = self._rcon_credentials()
         
         if admin_password:
             print(f"Using configured admin password for RCON")
@@ -759,16 +685,25 @@ class ServerManager:
                 print(f"ERROR: Password must be {MIN_PASSWORD_LENGTH}-{MAX_PASSWORD_LENGTH} characters")
                 return
         
-        rcon = RCONClient(password=password)
-        if not rcon.connect():
-            print("Connection failed. Ensure:")
-            print("  1. Server is running")
-            print("  2. RCON is enabled in server settings")
-            print("  3. Password is correct")
+        rcon = self._get_rcon(password, rcon_port)
+        if not rcon:
+            sys.stdout.write(self._RCON_HELP_TEXT)
             return
         
-        print("✓ Connected. Type 'exit' to quit.")
-        print("Common commands: SaveWorld, ListPlayers, Broadcast <message>")
+        if not sys.stdin.isatty():
+            self._run_rcon_script(rcon)
+            return
+        
+        try:
+            # Line editing and command history for input(); not on Windows
+            import readline  # noqa: F401
+        except ImportError:
+            pass
+        
+        sys.stdout.write(
+            "✓ Connected. Type 'exit' to quit.\n"
+            "Common commands: SaveWorld, ListPlayers, Broadcast <message>\n"
+        )
         
         while True:
             cmd = input("RCON> ")
@@ -781,16 +716,79 @@ class ServerManager:
             response = rcon.send_command(cmd)
             if response:
                 print(response)
-        
+    
+    def _rcon_credentials(self) -> Tuple[int, str]:
+        """Return the configured (rcon_port, admin_password)"""
+        settings = self._snapshot().settings
+        return settings.get('rcon_port', DEFAULT_RCON_PORT), settings.get('admin_password', '')
+    
+    def _get_rcon(self, password: str, port: int = DEFAULT_RCON_PORT):
+        """Return the shared RCON session, connecting only when it is not already open"""
+        rcon = self.rcon
+        if rcon is None or rcon.port != port or rcon.password != password:
+            if rcon is not None:
+                rcon.disconnect()
+            from core.rcon import RCONClient
+            rcon = self.rcon = RCONClient(port=port, password=password)
+        
+        if rcon.authenticated:
+            return rcon
+        rcon.disconnect()
+        if rcon.connect():
+            return rcon
         rcon.disconnect()
+        return None
+    
+    def _run_rcon_script(self, rcon):
+        """Send all commands piped on stdin in one batch, up to an 'exit' line"""
+        commands = []
+        # Line by line, so menu choices after 'exit' stay unread for run()
+        readline = sys.stdin.readline
+        for line in iter(readline, ''):
+            line = line.strip()
+            if line.lower() == 'exit':
+                break
+            if line:
+                commands.append(line)
+        
+        if commands:
+            responses = rcon.send_commands(commands)
+            output = "\n".join(response for response in responses if response)
+            if output:
+                sys.stdout.write(output + "\n")
     
     def view_logs(self):
         from utils.log_viewer import LogViewer
-        viewer = LogViewer(self.steamcmd.server_dir)
+        viewer = LogViewer(self.server_dir)
         viewer.show()
     
+    def install_signal_handlers(self):
+        """Route SIGTERM/SIGQUIT through the same graceful path as Ctrl+C"""
+        for name in ('SIGTERM', 'SIGQUIT'):
+            signum = getattr(signal, name, None)  # SIGQUIT is POSIX-only
+            if signum is not None:
+                signal.signal(signum, self._signal_shutdown)
+    
+    @staticmethod
+    def _signal_shutdown(signum, frame):
+        raise KeyboardInterrupt
+    
+    def shutdown_gracefully(self):
+        """Save and stop a running server after an interrupt"""
+        try:
+            if self.controller.is_running():
+                self.stop_server()
+        except KeyboardInterrupt:
+            # Interrupted again while saving: stop waiting on RCON
+            print("\nForcing server stop...")
+            self.controller.stop()
+        if self.rcon is not None:
+            self.rcon.disconnect()
+    
     def _shutdown(self):
         print("\nShutting down...")
+        if self.rcon is not None:
+            self.rcon.disconnect()
         if self.controller.is_running():
             self.controller.stop()
         print("Goodbye!")
@@ -799,15 +797,19 @@ class ServerManager:
 def main():
     print("ARK: Survival Ascended Dedicated Server Manager")
     print("Phase 1 - Minimal Secure Implementation")
-    print("="*60)
+    print(_BANNER)
     
     base_dir = sys.argv[1] if len(sys.argv) > 1 else "./ArkServerManager"
     
+    manager = None
     try:
         manager = ServerManager(base_dir)
+        manager.install_signal_handlers()
         manager.run()
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
+        if manager is not None:
+            manager.shutdown_gracefully()
     except Exception as e:
         print(f"\nFATAL ERROR: {e}")
         import traceback
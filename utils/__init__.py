@@ -8,6 +8,7 @@ from .constants import (
     DEFAULT_QUERY_PORT,
     DEFAULT_RCON_PORT,
     MAX_INPUT_LENGTH,
+    MAX_MOD_ID_LENGTH,
     MAX_PASSWORD_LENGTH,
     MAX_SERVER_NAME_LENGTH,
     MIN_PASSWORD_LENGTH,
@@ -23,7 +24,7 @@ from .validation import (
     input_float,
 )
 
-from .log_viewer import LogViewer
+from .ini import FastIni
 
 __all__ = [
     'ARK_APP_ID',
@@ -31,6 +32,7 @@ __all__ = [
     'DEFAULT_QUERY_PORT',
     'DEFAULT_RCON_PORT',
     'MAX_INPUT_LENGTH',
+    'MAX_MOD_ID_LENGTH',
     'MAX_PASSWORD_LENGTH',
     'MAX_SERVER_NAME_LENGTH',
     'MIN_PASSWORD_LENGTH',
@@ -41,5 +43,5 @@ __all__ = [
     'validate_strong_password',
     'input_int',
     'input_float',
-    'LogViewer',
-]
\ No newline at end of file
+    'FastIni',
+]
@@ -15,6 +15,7 @@ MAX_INPUT_LENGTH = 256
 MAX_PASSWORD_LENGTH = 128
 MAX_SERVER_NAME_LENGTH = 128
 MIN_PASSWORD_LENGTH = 8
+MAX_MOD_ID_LENGTH = 12
 
 # RCON protocol constants
 RCON_AUTH = 3
@@ -0,0 +1,72 @@
+"""
+Lightweight INI parsing for ARK configuration files
+"""
+
+import re
+from typing import Dict, List, Union
+
+SECTION_RE = re.compile(r'\[([^\]]+)\]')
+COMMENT_PREFIXES = (';', '#')
+
+# A key that appears more than once in a section keeps every value, in order
+IniValue = Union[str, List[str]]
+
+
+class FastIni:
+    """Parse and serialize ARK INI files as plain nested dicts
+
+    ARK only uses '[Section]' headers and 'Key=Value' lines, so this skips
+    configparser's interpolation, multiline and per-line bookkeeping.
+    Game.ini repeats some keys (e.g. OverridePlayerLevelEngramPoints); those
+    are kept as a list of values and written back one line each.
+    """
+
+    @staticmethod
+    def parse_text(text: str) -> Dict[str, Dict[str, IniValue]]:
+        """Parse INI text into {section: {key: value}}"""
+        data: Dict[str, Dict[str, IniValue]] = {}
+        current = None
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith(COMMENT_PREFIXES):
+                continue
+
+            if line[0] == '[':
+                match = SECTION_RE.match(line)
+                if match:
+                    current = data.setdefault(match.group(1), {})
+                    continue
+
+            if current is None:
+                continue
+
+            key, sep, value = line.partition('=')
+            key = key.rstrip()
+            if not (sep and key):
+                continue
+            value = value.lstrip()
+            existing = current.get(key)
+            if existing is None:
+                current[key] = value
+            elif isinstance(existing, list):
+                existing.append(value)
+            else:
+                current[key] = [existing, value]
+
+        return data
+
+    @staticmethod
+    def dumps(data: Dict[str, Dict[str, IniValue]]) -> str:
+        """Serialize {section: {key: value}} into one string"""
+        parts = []
+        for section, values in data.items():
+            parts.append(f"[{section}]")
+            for key, value in values.items():
+                if isinstance(value, list):
+                    parts.extend([f"{key}={item}" for item in value])
+                else:
+                    parts.append(f"{key}={value}")
+            parts.append("")
+        # Each section ends with a blank line
+        return "\n".join(parts) + "\n" if parts else ""
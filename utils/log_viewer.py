@@ -2,9 +2,19 @@
 Log viewing utility
 """
 
+import heapq
+import mmap
 import os
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from typing import List, Tuple
+
+# Block size for the reverse-seek fallback when a log cannot be mapped
+TAIL_CHUNK_SIZE = 64 * 1024
+
+# How many of the newest log files the menu lists
+RECENT_LOGS = 10
 
 
 class LogViewer:
@@ -22,19 +32,17 @@ class LogViewer:
         print("\n=== Server Logs ===")
         print(f"Log directory: {self.log_dir}\n")
         
-        log_files = sorted(self.log_dir.glob("*.log"), 
-                          key=lambda p: p.stat().st_mtime, 
-                          reverse=True)
+        log_files = self._list_logs(RECENT_LOGS)
         
         if not log_files:
             print("No log files found")
             return
         
         print("Recent log files:")
-        for i, log_file in enumerate(log_files[:10], 1):
-            size_kb = log_file.stat().st_size / 1024
-            modified = datetime.fromtimestamp(log_file.stat().st_mtime)
-            print(f"{i}. {log_file.name} ({size_kb:.1f} KB, {modified.strftime('%Y-%m-%d %H:%M')})")
+        for i, (log_file, st) in enumerate(log_files, 1):
+            size_kb = st.st_size / 1024
+            modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(st.st_mtime))
+            print(f"{i}. {log_file.name} ({size_kb:.1f} KB, {modified})")
         
         print("\nOptions:")
         print("1. View tail of most recent log")
@@ -44,7 +52,7 @@ class LogViewer:
         choice = input("\nChoice: ").strip()
         
         if choice == '1' and log_files:
-            self._tail_log(log_files[0])
+            self._tail_log(log_files[0][0])
         elif choice == '2':
             try:
                 os.startfile(self.log_dir)
@@ -52,19 +60,89 @@ class LogViewer:
                 print(f"Could not open directory: {e}")
                 print(f"Manual path: {self.log_dir}")
     
+    def _list_logs(self, limit: int) -> List[Tuple[Path, os.stat_result]]:
+        """Return (path, stat) for the newest limit *.log files, statting each once"""
+        # Scanning through a directory fd makes each entry.stat() an fstatat
+        # relative to it (POSIX); Windows scandir already carries the stat data
+        fd = None
+        if os.scandir in os.supports_fd:
+            fd = os.open(self.log_dir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        try:
+            with os.scandir(self.log_dir if fd is None else fd) as it:
+                entries = [
+                    (self.log_dir / entry.name, entry.stat())
+                    for entry in it
+                    if entry.name.endswith('.log') and entry.is_file()
+                ]
+        finally:
+            if fd is not None:
+                os.close(fd)
+        # Partial sort: rotated logs pile up but only a few are shown
+        return heapq.nlargest(limit, entries, key=lambda item: item[1].st_mtime)
+    
     def _tail_log(self, log_file: Path, lines: int = 50):
         """Display last N lines of log"""
         try:
             print(f"\n=== Last {lines} lines of {log_file.name} ===\n")
             
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-                tail_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-                
-                for line in tail_lines:
-                    print(line.rstrip())
+            tail = self._read_tail(log_file, lines)
+            if tail:
+                # Hand the bytes straight to stdout without decoding each line
+                sys.stdout.flush()
+                out = sys.stdout.buffer
+                out.write(tail)
+                out.write(b'\n')
+                out.flush()
             
             print(f"\n=== End of log ===")
             
         except Exception as e:
-            print(f"Error reading log file: {e}")
\ No newline at end of file
+            print(f"Error reading log file: {e}")
+    
+    @staticmethod
+    def _read_tail(log_file: Path, lines: int) -> bytes:
+        """Return the bytes of the last N lines, touching only the end of the file"""
+        with open(log_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return b''  # mmap cannot map an empty file
+            
+            # Server logs grow to hundreds of MB; map them and scan backwards
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return LogViewer._read_tail_chunked(f, size, lines)
+            
+            with mm:
+                end = size
+                if mm[end - 1] == 0x0A:
+                    end -= 1  # A trailing newline does not start another line
+                pos = end
+                for _ in range(lines):
+                    pos = mm.rfind(b'\n', 0, pos)
+                    if pos < 0:
+                        break
+                return mm[pos + 1:end]
+    
+    @staticmethod
+    def _read_tail_chunked(f, size: int, lines: int) -> bytes:
+        """Read whole blocks backwards from the end until N lines are buffered"""
+        if hasattr(os, 'posix_fadvise'):
+            # Reading backwards defeats forward readahead; ask for the
+            # last few blocks up front instead (Linux/BSD only)
+            os.posix_fadvise(f.fileno(), max(0, size - 4 * TAIL_CHUNK_SIZE), 0, os.POSIX_FADV_WILLNEED)
+        
+        buf = b''
+        pos = size
+        while pos:
+            block = min(TAIL_CHUNK_SIZE, pos)
+            pos -= block
+            f.seek(pos)
+            buf = f.read(block) + buf
+            # One extra newline is the boundary before the first wanted line
+            if buf.count(b'\n', 0, len(buf) - 1) >= lines:
+                break
+        
+        if buf.endswith(b'\n'):
+            buf = buf[:-1]
+        return b'\n'.join(buf.split(b'\n')[-lines:])
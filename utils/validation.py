@@ -2,17 +2,31 @@
 Input validation and sanitization utilities
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from .constants import MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH, MAX_INPUT_LENGTH
+from .constants import (
+    MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH, MAX_INPUT_LENGTH, MAX_MOD_ID_LENGTH
+)
 
+# Characters stripped by sanitize_input, as a set for the clean-input check
+# and a str.translate deletion table for everything else
+_DANGEROUS_CHARS = frozenset('&|;$`\n\r<>"\'')
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(_DANGEROUS_CHARS))
 
+
+@lru_cache(maxsize=128)
 def validate_path(path: str) -> Path:
-    """Validate and sanitize file system paths"""
-    p = Path(path).resolve()
-    if ".." in str(p):
+    """Validate and sanitize file system paths (memoized per input string)
+    
+    Purely lexical: normpath folds inner '..' segments, so any left over
+    climb above the starting directory. No symlinks are followed.
+    """
+    norm = os.path.normpath(path)
+    if '..' in norm.replace('\\', '/').split('/'):
         raise ValueError("Path traversal detected")
-    return p
+    return Path(os.path.abspath(norm))
 
 
 def validate_port(port: int) -> int:
@@ -23,23 +37,23 @@ def validate_port(port: int) -> int:
 
 
 def validate_mod_id(mod_id: str) -> bool:
-    """Check if mod ID is numeric"""
-    return mod_id.strip().isdigit()
+    """Check if mod ID is a plain ASCII number of sane length"""
+    mod_id = mod_id.strip()
+    return mod_id.isdigit() and mod_id.isascii() and len(mod_id) <= MAX_MOD_ID_LENGTH
 
 
 def sanitize_input(value: str, max_length: int = MAX_INPUT_LENGTH) -> str:
     """Remove dangerous characters and enforce length limit"""
-    dangerous_chars = ['&', '|', ';', '$', '`', '\n', '\r', '<', '>', '"', "'"]
-    for char in dangerous_chars:
-        value = value.replace(char, '')
-    return value.strip()[:max_length]
+    if _DANGEROUS_CHARS.isdisjoint(value):
+        # Usual case: nothing to strip, so skip building a translated copy
+        return value.strip()[:max_length]
+    return value.translate(_SANITIZE_TABLE).strip()[:max_length]
 
 
 def validate_strong_password(password: str) -> bool:
     """Check password meets minimum requirements"""
-    if len(password) < MIN_PASSWORD_LENGTH or len(password) > MAX_PASSWORD_LENGTH:
-        return False
-    return bool(password.strip())
+    # isspace() rejects all-blank passwords without building a stripped copy
+    return MIN_PASSWORD_LENGTH <= len(password) <= MAX_PASSWORD_LENGTH and not password.isspace()
 
 
 def input_int(prompt: str, default: Optional[int] = None) -> int: